@@ -0,0 +1,7 @@
+"""
+pytest configuration for Webex Terminal.
+"""
+
+# test_webex_terminal.py is a manual smoke script that needs real Webex
+# credentials and exits without them, so pytest only collects tests/
+collect_ignore = ["test_webex_terminal.py"]
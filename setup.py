@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="webex-terminal",
     version="0.2.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     install_requires=[
         "blessed",
         "certifi",
@@ -20,6 +20,7 @@ setup(
         "prompt-toolkit",
         "PyYAML",
         "requests",
+        "requests-toolbelt",
         "texttable",
         "tomli",
         "tqdm",
@@ -30,6 +31,9 @@ setup(
         "websockets",
         "zipp",
     ],
+    extras_require={
+        "fast": ["brotli", "orjson"],
+    },
     entry_points={
         "console_scripts": [
             "webex-terminal=webex_terminal.cli.main:main",
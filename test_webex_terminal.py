@@ -11,8 +11,12 @@ Usage:
 """
 import os
 import sys
-import subprocess
-import time
+
+from click.testing import CliRunner
+
+from webex_terminal.api.client import WebexClient, WebexAPIError
+from webex_terminal.auth.auth import authenticate, is_authenticated
+from webex_terminal.cli.main import cli, display_rooms
 
 # Check if environment variables are set
 client_id = os.environ.get('WEBEX_CLIENT_ID')
@@ -23,22 +27,36 @@ if not client_id or not client_secret:
     print("You can obtain these from the Webex Developer Portal: https://developer.webex.com/my-apps")
     sys.exit(1)
 
+# Everything below runs in this process, so the package is only imported once
+# instead of paying interpreter startup and imports for every step
+
+# Test the command line entry point
+print("\n=== Testing CLI Entry Point ===")
+print("Running 'webex-terminal --help'...")
+runner = CliRunner()
+result = runner.invoke(cli, ["--help"])
+if result.exit_code != 0:
+    print(f"CLI entry point failed: {result.output}")
+    sys.exit(1)
+print("CLI entry point loaded.")
+
 # Test authentication
 print("\n=== Testing Authentication ===")
-print("Running 'webex-terminal auth'...")
-try:
-    result = subprocess.run(["python", "-m", "webex_terminal.cli.main", "auth"], check=True)
+if is_authenticated():
+    print("Authentication successful or already authenticated.")
+else:
+    success, error = authenticate(client_id, client_secret)
+    if not success:
+        print(f"Authentication failed: {error}")
+        print("Please check your credentials and try again.")
+        sys.exit(1)
     print("Authentication successful or already authenticated.")
-except subprocess.CalledProcessError:
-    print("Authentication failed. Please check your credentials and try again.")
-    sys.exit(1)
 
 # Test listing rooms
 print("\n=== Testing Room Listing ===")
-print("Running 'webex-terminal list-rooms'...")
 try:
-    result = subprocess.run(["python", "-m", "webex_terminal.cli.main", "list-rooms"], check=True)
-except subprocess.CalledProcessError:
+    display_rooms(WebexClient(), use_print=True)
+except WebexAPIError:
     print("Failed to list rooms. Make sure you're authenticated.")
     sys.exit(1)
 
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the Webex Terminal unit tests.
+"""
+import pytest
+
+import webex_terminal.api.client as client_module
+from tests.helpers import BASE_URL, make_response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A WebexClient with a fixed configuration and token, and no pacing."""
+    monkeypatch.setattr(client_module, "load_config", lambda: {"api_base_url": BASE_URL})
+    monkeypatch.setattr(client_module, "get_token", lambda: {"access_token": "token"})
+    return client_module.WebexClient(requests_per_second=0)
+
+
+@pytest.fixture
+def wire(client, monkeypatch):
+    """Record the requests the client sends and answer them from a handler.
+
+    Set ``wire.handler`` to a function taking (method, url, kwargs) and
+    returning a requests.Response; the calls are kept in ``wire.calls``.
+    """
+
+    class Wire:
+        def __init__(self):
+            self.calls = []
+            self.handler = lambda method, url, kwargs: make_response(200, {})
+
+        def request(self, method, url, **kwargs):
+            self.calls.append((method, url, kwargs))
+            return self.handler(method, url, kwargs)
+
+    recorder = Wire()
+    monkeypatch.setattr(client.session, "request", recorder.request)
+    return recorder
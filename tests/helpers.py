@@ -0,0 +1,39 @@
+"""
+Helpers shared by the Webex Terminal unit tests.
+"""
+import io
+import json
+
+import requests
+import urllib3
+
+BASE_URL = "https://webexapis.com/v1"
+
+
+def make_response(status_code=200, body=b"", headers=None, url=""):
+    """Build a requests.Response whose body can be read as content or streamed.
+
+    Args:
+        status_code (int, optional): The HTTP status code. Defaults to 200.
+        body (bytes or dict, optional): The body; dictionaries are encoded as JSON.
+        headers (dict, optional): The response headers.
+        url (str, optional): The request URL.
+
+    Returns:
+        requests.Response: The response.
+    """
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.url = url
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers or {},
+        status=status_code,
+        preload_content=False,
+        decode_content=False,
+    )
+    return response
@@ -0,0 +1,68 @@
+"""
+Unit tests for the asyncio front end of the Webex API client.
+"""
+import asyncio
+import threading
+
+from webex_terminal.api.async_client import AsyncWebexClient
+from webex_terminal.api.client import WebexAPIError
+from tests.helpers import BASE_URL, make_response
+
+
+def test_calls_run_off_the_event_loop_thread(client, wire):
+    threads = []
+
+    def handler(method, url, kwargs):
+        threads.append(threading.current_thread())
+        return make_response(200, {"id": url.rsplit("/", 1)[-1]})
+
+    wire.handler = handler
+
+    async def lookups():
+        async_client = AsyncWebexClient(client)
+        return await asyncio.gather(async_client.get_room("r1"), async_client.get_person("p1"))
+
+    room, person = asyncio.run(lookups())
+
+    assert room == {"id": "r1"}
+    assert person == {"id": "p1"}
+    assert sorted(call[1] for call in wire.calls) == [f"{BASE_URL}/people/p1", f"{BASE_URL}/rooms/r1"]
+    assert threading.main_thread() not in threads
+
+
+def test_download_files_from_urls_keeps_order_and_returns_failures(client, wire, tmp_path):
+    def download_file_from_url(file_url, save_path=None):
+        if file_url.endswith("/missing"):
+            raise WebexAPIError("Not found", 404)
+        return str(tmp_path / file_url.rsplit("/", 1)[-1])
+
+    client.download_file_from_url = download_file_from_url
+    file_urls = [f"{BASE_URL}/contents/a", f"{BASE_URL}/contents/missing", f"{BASE_URL}/contents/b"]
+
+    paths = asyncio.run(
+        AsyncWebexClient(client).download_files_from_urls(file_urls, limit=2, return_exceptions=True)
+    )
+
+    assert paths[0] == str(tmp_path / "a")
+    assert isinstance(paths[1], WebexAPIError)
+    assert paths[2] == str(tmp_path / "b")
+
+
+def test_room_details_and_members_are_fetched_together(client, wire):
+    def handler(method, url, kwargs):
+        if url.endswith("/rooms/r1"):
+            return make_response(200, {"id": "r1", "title": "Room"})
+        return make_response(200, {"items": [{"personId": "p1"}, {"personId": "p2"}]})
+
+    wire.handler = handler
+
+    async def details():
+        async_client = AsyncWebexClient(client)
+        return await asyncio.gather(async_client.get_room("r1"), async_client.list_room_members("r1"))
+
+    room, members = asyncio.run(details())
+
+    assert room["title"] == "Room"
+    assert [member["personId"] for member in members] == ["p1", "p2"]
+    membership_calls = [call for call in wire.calls if call[1].endswith("/memberships")]
+    assert membership_calls[0][2]["params"]["roomId"] == "r1"
@@ -0,0 +1,41 @@
+"""
+Unit tests for the in-memory caches used by the Webex API client.
+"""
+from webex_terminal.api import cache
+from webex_terminal.api.cache import TTLCache
+
+
+def test_evicts_least_recently_used_entry():
+    ttl_cache = TTLCache(maxsize=2, ttl=None)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache(maxsize=4, ttl=10)
+    ttl_cache.set("a", 1)
+
+    now[0] = 109.0
+    assert ttl_cache.get("a") == 1
+    now[0] = 110.0
+    assert ttl_cache.get("a", "missing") == "missing"
+    assert len(ttl_cache) == 0
+
+
+def test_pop_and_clear():
+    ttl_cache = TTLCache()
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    assert ttl_cache.pop("a") == 1
+    assert ttl_cache.pop("a", "missing") == "missing"
+    ttl_cache.clear()
+    assert ttl_cache.get("b") is None
@@ -0,0 +1,236 @@
+"""
+Unit tests for the Webex API client.
+"""
+import os
+import threading
+import time
+
+import pytest
+
+import webex_terminal.api.client as client_module
+from webex_terminal.api import cache
+from webex_terminal.api.client import WebexAPIError, _extract_filename
+from tests.helpers import BASE_URL, make_response
+
+
+def test_request_keeps_mixed_case_room_id(client, wire):
+    wire.handler = lambda method, url, kwargs: make_response(200, {"id": "AbC"})
+
+    client.get_room("Y2lzY29zcGFyazovL3VzL1JPT00vAbC")
+
+    method, url, _ = wire.calls[0]
+    assert method == "GET"
+    assert url == f"{BASE_URL}/rooms/Y2lzY29zcGFyazovL3VzL1JPT00vAbC"
+
+
+def test_request_raises_api_error_on_error_status(client, wire):
+    wire.handler = lambda method, url, kwargs: make_response(
+        404, {"message": "Not found"}, {"Retry-After": "3"}
+    )
+
+    with pytest.raises(WebexAPIError) as exc_info:
+        client._request("GET", "rooms/missing")
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.retry_after == 3
+
+
+def test_request_revalidates_with_etag(client, wire):
+    def handler(method, url, kwargs):
+        if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+            return make_response(304)
+        return make_response(200, {"id": "r1", "title": "Room"}, {"ETag": '"v1"'})
+
+    wire.handler = handler
+
+    first = client._request("GET", "rooms/r1")
+    second = client._request("GET", "rooms/r1")
+
+    assert first == second == {"id": "r1", "title": "Room"}
+    assert "headers" not in wire.calls[0][2]
+    assert wire.calls[1][2]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_paginate_follows_next_links(client, wire):
+    pages = {
+        f"{BASE_URL}/rooms": make_response(
+            200,
+            {"items": [{"id": "r1"}]},
+            {"Link": f'<{BASE_URL}/rooms?cursor=a,b>; rel="next"'},
+        ),
+        f"{BASE_URL}/rooms?cursor=a,b": make_response(200, {"items": [{"id": "r2"}]}),
+    }
+    wire.handler = lambda method, url, kwargs: pages[url]
+
+    rooms = list(client._paginate(f"{BASE_URL}/rooms", {"max": 1}))
+
+    assert [room["id"] for room in rooms] == ["r1", "r2"]
+    assert wire.calls[0][2]["params"] == {"max": 1}
+    assert wire.calls[1][2]["params"] == {}
+
+
+def test_fetch_file_details_skips_empty_probe_results(client, wire):
+    def handler(method, url, kwargs):
+        if method == "HEAD":
+            return make_response(405)
+        if "/attachment/actions/" in url:
+            return make_response(200, {"name": "report.pdf"})
+        if "/attachment/" in url:
+            return make_response(200, b"")
+        return make_response(200, b"%PDF")
+
+    wire.handler = handler
+
+    assert client.get_file_details("f1") == {"name": "report.pdf"}
+    assert client._file_details_endpoint == "attachment/actions/{}"
+
+
+@pytest.mark.skipif(not hasattr(os, "pwrite"), reason="ranged downloads need os.pwrite")
+def test_download_splits_large_files_into_ranges(client, wire, tmp_path):
+    content = bytes(range(256)) * 40
+    client.RANGE_DOWNLOAD_THRESHOLD = 1024
+    client.RANGE_DOWNLOAD_PARTS = 3
+
+    def handler(method, url, kwargs):
+        byte_range = kwargs.get("headers", {}).get("Range")
+        if byte_range is None:
+            return make_response(
+                200,
+                content,
+                {"Content-Length": str(len(content)), "Accept-Ranges": "bytes"},
+            )
+        start, end = map(int, byte_range[len("bytes="):].split("-"))
+        return make_response(206, content[start:end + 1])
+
+    wire.handler = handler
+
+    save_path = client.download_file_from_url(
+        "https://files.example.com/report.bin", str(tmp_path / "report.bin")
+    )
+
+    with open(save_path, "rb") as f:
+        assert f.read() == content
+    ranges = sorted(call[2]["headers"].get("Range", "") for call in wire.calls)
+    assert ranges == ["", "bytes=3414-6827", "bytes=6828-10239"]
+    assert all(call[2]["headers"]["Accept-Encoding"] == "identity" for call in wire.calls)
+
+
+@pytest.mark.parametrize(
+    "message, file_url, expected",
+    [
+        ({"content": {"files": [{"name": "notes.txt"}]}}, f"{BASE_URL}/contents/f1", "notes.txt"),
+        ({}, "https://files.example.com/path/photo.png", "photo.png"),
+        ({"text": "uploaded: slides.pptx"}, f"{BASE_URL}/contents/f1", "slides.pptx"),
+        ({"text": None}, f"{BASE_URL}/contents/f1", "f1"),
+    ],
+)
+def test_extract_filename(message, file_url, expected):
+    assert _extract_filename(message, file_url, "f1") == expected
+
+
+def test_open_file_requests_identity_encoding(client, wire):
+    wire.handler = lambda method, url, kwargs: make_response(
+        200, b"data", {"Content-Length": "4", "Content-Disposition": 'attachment; filename="a.txt"'}
+    )
+
+    details, response = client.open_file("f1")
+    with response:
+        assert response.raw.read() == b"data"
+
+    assert details["name"] == "a.txt"
+    assert details["size"] == 4
+    assert wire.calls[0][2]["headers"]["Accept-Encoding"] == "identity"
+
+
+def test_download_files_gives_same_named_files_distinct_paths(client, monkeypatch, tmp_path):
+    files = [
+        {"filename": "report.pdf", "url": f"{BASE_URL}/contents/f1", "id": "f1"},
+        {"filename": "report.pdf", "url": f"{BASE_URL}/contents/f2", "id": "f2"},
+    ]
+    monkeypatch.setattr(client, "list_files", lambda room_id: files)
+    downloaded = {}
+
+    def stream_to_file(url, save_path, desc):
+        downloaded[save_path] = url
+        return save_path
+
+    monkeypatch.setattr(client, "_stream_to_file", stream_to_file)
+
+    paths = client.download_files("r1", ["f1", "f2", "F1"], str(tmp_path / "out"))
+
+    first, second = str(tmp_path / "out" / "report.pdf"), str(tmp_path / "out" / "report (1).pdf")
+    assert paths == [first, second, first]
+    assert downloaded == {first: f"{BASE_URL}/contents/f1", second: f"{BASE_URL}/contents/f2"}
+
+
+def test_expiring_token_is_reloaded_once_across_threads(client, monkeypatch):
+    reloads = []
+
+    def get_token():
+        reloads.append(threading.current_thread())
+        time.sleep(0.05)
+        return {"access_token": "new", "expires_at": time.time() + 3600}
+
+    client._auth_headers = {"Authorization": "Bearer old"}
+    client._token_expires_at = time.time() + 10
+    monkeypatch.setattr(client_module, "get_token", get_token)
+
+    threads = [threading.Thread(target=client._ensure_auth) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(reloads) == 1
+    assert client.session.headers["Authorization"] == "Bearer new"
+
+
+def test_list_files_refresh_looks_up_missing_files_again(client, wire, monkeypatch):
+    messages = [{"id": "m1", "files": [f"{BASE_URL}/contents/f1"]}]
+    monkeypatch.setattr(client, "list_messages", lambda room_id, max_results: messages)
+    wire.handler = lambda method, url, kwargs: make_response(503)
+
+    assert client.list_files("r1")[0]["filename"] == "f1"
+
+    wire.handler = lambda method, url, kwargs: make_response(
+        200, headers={"Content-Disposition": 'attachment; filename="report.pdf"'}
+    )
+
+    assert client.list_files("r1")[0]["filename"] == "f1"
+    assert client.list_files("r1", refresh=True)[0]["filename"] == "report.pdf"
+
+
+def test_get_message_fetches_edited_message_after_ttl(client, wire, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    texts = iter(["first", "edited"])
+    wire.handler = lambda method, url, kwargs: make_response(200, {"id": "m1", "text": next(texts)})
+
+    assert client.get_message("m1")["text"] == "first"
+    assert client.get_message("m1")["text"] == "first"
+    now[0] += 60
+    assert client.get_message("m1")["text"] == "edited"
+
+
+def test_rate_limited_post_waits_out_short_retry_after(client, wire, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    responses = iter([make_response(429, headers={"Retry-After": "2"}), make_response(200, {"id": "m1"})])
+    wire.handler = lambda method, url, kwargs: next(responses)
+
+    assert client.create_message("r1", "hello") == {"id": "m1"}
+    assert sleeps == [2]
+
+
+def test_rate_limited_post_raises_instead_of_long_wait(client, wire, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    wire.handler = lambda method, url, kwargs: make_response(429, headers={"Retry-After": "600"})
+
+    with pytest.raises(WebexAPIError) as exc_info:
+        client.create_message("r1", "hello")
+
+    assert exc_info.value.retry_after == 600
+    assert "retry after 600 seconds" in str(exc_info.value)
+    assert sleeps == []
+    assert len(wire.calls) == 1
@@ -0,0 +1,38 @@
+"""
+Unit tests for the client-side rate limiter.
+"""
+from webex_terminal.api import ratelimit
+from webex_terminal.api.ratelimit import TokenBucket
+
+
+def test_burst_goes_out_at_once_then_waits_for_refill(monkeypatch):
+    now = [0.0]
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+    bucket = TokenBucket(rate=10, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == [0.1, 0.2]
+
+
+def test_tokens_refill_up_to_burst(monkeypatch):
+    now = [0.0]
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    now[0] = 60.0
+    for _ in range(2):
+        bucket.acquire()
+    assert sleeps == []
+    bucket.acquire()
+    assert sleeps == [0.1]
@@ -0,0 +1,232 @@
+"""
+Asyncio front end for the Webex API client.
+"""
+import asyncio
+import functools
+from typing import Any, Callable, Dict, List, Optional
+
+from webex_terminal.api.client import WebexClient
+
+
+class AsyncWebexClient:
+    """Asyncio front end for WebexClient.
+
+    This class exposes the lookups that are triggered from the websocket event
+    loop as coroutines. Each coroutine runs the matching WebexClient method on
+    the event loop's default thread pool, so a lookup never blocks the event loop
+    and several lookups can be awaited together with asyncio.gather. The calls
+    share the synchronous client's keep-alive connections, authentication headers
+    and caches. The client's own thread pool is left free for the concurrent
+    lookups that methods such as list_files make internally.
+
+    Attributes:
+        client (WebexClient): The synchronous client the calls are delegated to.
+    """
+
+    def __init__(self, client: Optional[WebexClient] = None):
+        """Initialize the asyncio client.
+
+        Args:
+            client (WebexClient, optional): The client to delegate to. If not provided,
+                                           a new WebexClient is created.
+
+        Returns:
+            None
+        """
+        self.client = client or WebexClient()
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking client method on the event loop's default thread pool.
+
+        Args:
+            func (Callable): The client method to call.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Any: The value returned by the method.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def get_me(self) -> Dict:
+        """Get information about the authenticated user.
+
+        Returns:
+            Dict: A dictionary containing the user's profile information.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        return await self._run(self.client.get_me)
+
+    async def get_room(self, room_id: str) -> Dict:
+        """Get details for a specific room.
+
+        Args:
+            room_id (str): ID of the room to retrieve information for.
+
+        Returns:
+            Dict: A dictionary containing information about the room.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request or if the room doesn't exist.
+        """
+        return await self._run(self.client.get_room, room_id)
+
+    async def get_message(self, message_id: str) -> Dict:
+        """Get details for a specific message.
+
+        Args:
+            message_id (str): ID of the message to retrieve information for.
+
+        Returns:
+            Dict: A dictionary containing information about the message.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request or if the message doesn't exist.
+        """
+        return await self._run(self.client.get_message, message_id)
+
+    async def get_person(self, person_id: str) -> Dict:
+        """Get details for a specific person.
+
+        Args:
+            person_id (str): ID of the person to retrieve information for.
+
+        Returns:
+            Dict: A dictionary containing information about the person.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request or if the person doesn't exist.
+        """
+        return await self._run(self.client.get_person, person_id)
+
+    async def list_messages(self, room_id: str, max_results: int = 50) -> List[Dict]:
+        """List messages in a room.
+
+        Args:
+            room_id (str): ID of the room to retrieve messages from.
+            max_results (int, optional): Maximum number of messages to return. Defaults to 50.
+
+        Returns:
+            List[Dict]: A list of dictionaries, each containing information about a message.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        return await self._run(self.client.list_messages, room_id, max_results)
+
+    async def list_room_members(self, room_id: str, max_results: int = 100) -> List[Dict]:
+        """List members of a room.
+
+        Args:
+            room_id (str): ID of the room to retrieve members from.
+            max_results (int, optional): Maximum number of members to return per page. Defaults to 100.
+
+        Returns:
+            List[Dict]: A list of dictionaries, each containing information about a room membership.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        return await self._run(self.client.list_room_members, room_id, max_results)
+
+    async def list_files(
+        self, room_id: str, max_results: int = 100, refresh: bool = False
+    ) -> List[Dict]:
+        """List files available in a room.
+
+        Args:
+            room_id (str): ID of the room to search for files.
+            max_results (int, optional): Maximum number of messages to retrieve per page. Defaults to 100.
+            refresh (bool, optional): Whether to ignore a cached list and fetch it again.
+                                      Defaults to False.
+
+        Returns:
+            List[Dict]: A list of dictionaries, each containing information about a file.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        return await self._run(self.client.list_files, room_id, max_results, refresh)
+
+    async def download_file_from_url(self, file_url: str, save_path: str = None) -> str:
+        """Download a file directly from a URL.
+
+        Args:
+            file_url (str): URL of the file to download.
+            save_path (str, optional): Path where the file should be saved.
+                                      If not provided, the file will be saved
+                                      in a temporary directory.
+
+        Returns:
+            str: The path where the file was saved.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        return await self._run(self.client.download_file_from_url, file_url, save_path)
+
+    async def download_files_from_urls(
+        self, file_urls: List[str], limit: int = 8, return_exceptions: bool = False
+    ) -> List[Any]:
+        """Download several files concurrently.
+
+        Each file is saved in the temporary directory used by download_file_from_url.
+        At most ``limit`` downloads run at once, so a long list of URLs doesn't
+        occupy every thread of the default pool or open too many connections.
+
+        Args:
+            file_urls (List[str]): URLs of the files to download.
+            limit (int, optional): Maximum number of concurrent downloads. Defaults to 8.
+            return_exceptions (bool, optional): Whether a failed download is returned
+                                                in place of its path instead of being
+                                                raised. Defaults to False.
+
+        Returns:
+            List[Any]: The paths where the files were saved, in the order given, or
+                the exception raised for each download that failed if
+                return_exceptions is True.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def download(file_url: str) -> str:
+            async with semaphore:
+                return await self.download_file_from_url(file_url)
+
+        return list(
+            await asyncio.gather(
+                *(download(file_url) for file_url in file_urls),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def download_files(
+        self, room_id: str, filenames: List[str], save_path: str = None
+    ) -> List[str]:
+        """Download several files from a room concurrently.
+
+        Args:
+            room_id (str): ID of the room to search for the files.
+            filenames (List[str]): Names or IDs of the files to download.
+            save_path (str, optional): Directory where the files should be saved.
+                                      It is created if it doesn't exist. If not
+                                      provided, the files will be saved in the
+                                      current directory.
+
+        Returns:
+            List[str]: The paths where the files were saved, in the order requested.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+            FileNotFoundError: If one of the files is not found in the room.
+            FileExistsError: If save_path exists but is not a directory.
+        """
+        return await self._run(self.client.download_files, room_id, filenames, save_path)
@@ -0,0 +1,105 @@
+"""
+In-memory caches used by the Webex API client.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """A bounded least-recently-used cache whose entries can expire.
+
+    This class keeps at most ``maxsize`` entries, evicting the least recently
+    used one when full. Entries older than ``ttl`` seconds are treated as
+    missing. It is safe to share between threads.
+
+    Attributes:
+        maxsize (int): Maximum number of entries to keep.
+        ttl (Optional[float]): Seconds after which an entry expires, or None
+            if entries never expire.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 300):
+        """Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries to keep. Defaults to 512.
+            ttl (Optional[float], optional): Seconds after which an entry expires,
+                or None if entries never expire. Defaults to 300.
+
+        Returns:
+            None
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value from the cache.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any, optional): The value to return if the key is missing
+                or has expired. Defaults to None.
+
+        Returns:
+            Any: The cached value, or ``default``.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache, evicting the oldest entries if full.
+
+        Args:
+            key (Hashable): The key to store the value under.
+            value (Any): The value to store.
+
+        Returns:
+            None
+        """
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a value from the cache.
+
+        Args:
+            key (Hashable): The key to remove.
+            default (Any, optional): The value to return if the key is missing.
+                Defaults to None.
+
+        Returns:
+            Any: The removed value, or ``default``.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
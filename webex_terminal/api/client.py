@@ -1,13 +1,371 @@
 """
 Webex API client for interacting with the Webex API.
 """
+import concurrent.futures
+import functools
+import hashlib
+import itertools
+import os
+import posixpath
 import requests
 import re
-from typing import Dict, List, Optional, Any
-
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+from webex_terminal.api.cache import TTLCache
+from webex_terminal.api.ratelimit import TokenBucket
 from webex_terminal.auth.auth import get_token
 from webex_terminal.config import load_config
 
+# Prefer orjson for encoding and decoding JSON when it is installed (pip install webex-terminal[fast])
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Shared, read-only query parameters for list calls made with the default page size
+_DEFAULT_PAGE_SIZE = 100
+_DEFAULT_PAGE_PARAMS = MappingProxyType({"max": _DEFAULT_PAGE_SIZE})
+
+# Headers for downloading file content as stored, without compression, so that
+# Content-Length is the size on disk
+_IDENTITY_ENCODING = MappingProxyType({"Accept-Encoding": "identity"})
+
+# JSON endpoints probed for file details when a HEAD request returns none
+_FILE_DETAILS_ENDPOINTS = ("attachment/actions/{}", "attachment/{}")
+
+# Characters that are not safe in file names, each replaced with "_"
+_UNSAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys('\\/*?:"<>|', "_"))
+
+# Patterns used to work out file names, compiled once at import
+_URL_FILENAME_RE = re.compile(r"/([^/]+\.[a-zA-Z0-9]+)(?:\?|$)", re.IGNORECASE)
+_FILENAME_TEXT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:filename|file|uploaded|attached):\s*([^\s]+\.[a-zA-Z0-9]+)",
+        r"uploaded\s+([^\s]+\.[a-zA-Z0-9]+)",
+        r"attached\s+([^\s]+\.[a-zA-Z0-9]+)",
+        r"file\s+([^\s]+\.[a-zA-Z0-9]+)",
+        r"([^\s]+\.[a-zA-Z0-9]{2,4})",  # Look for any word ending with a file extension
+    )
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_camel_case(header: str) -> str:
+    """Convert an HTTP header name to camelCase to match Webex API convention.
+
+    Responses repeat the same header names, so the conversions are cached.
+
+    Args:
+        header (str): The header name, e.g. "Content-Length".
+
+    Returns:
+        str: The camelCase name, e.g. "contentLength".
+    """
+    header_parts = header.split("-")
+    return header_parts[0].lower() + "".join(part.capitalize() for part in header_parts[1:])
+
+
+# Message fields that may hold the name of an attached file, in order of preference.
+# Each entry is a path to a dictionary (None steps into every item of a list) and
+# the keys to check in it.
+_FILENAME_PATHS = (
+    ((), ("fileName",)),
+    (("content",), ("fileName", "name")),
+    (("content", "files", None), ("name", "fileName", "displayName")),
+    (("attachments", None), ("fileName", "name", "contentName", "displayName")),
+    (("attachments", None, "content"), ("fileName", "name")),
+)
+
+
+def _iter_path(value: Any, path: Tuple) -> Iterator[Dict]:
+    """Yield the dictionaries found by following a path into a message.
+
+    Args:
+        value (Any): The value to start from.
+        path (Tuple): Keys to follow. None steps into every item of a list.
+
+    Returns:
+        Iterator[Dict]: The dictionaries at the end of the path.
+    """
+    if not path:
+        if isinstance(value, dict):
+            yield value
+        return
+
+    key, rest = path[0], path[1:]
+    if key is None:
+        if isinstance(value, list):
+            for item in value:
+                yield from _iter_path(item, rest)
+    elif isinstance(value, dict) and key in value:
+        yield from _iter_path(value[key], rest)
+
+
+def _find_filename(message: Dict) -> Optional[str]:
+    """Find the name of an attached file in the fields of a message.
+
+    Args:
+        message (Dict): The message details.
+
+    Returns:
+        Optional[str]: The first filename found along _FILENAME_PATHS, or None.
+    """
+    for path, keys in _FILENAME_PATHS:
+        for container in _iter_path(message, path):
+            for key in keys:
+                filename = container.get(key)
+                if filename and isinstance(filename, str):
+                    return filename
+    return None
+
+
+def _extract_filename(message: Dict, file_url: str, file_id: str) -> str:
+    """Work out the name of an attached file without its details from the API.
+
+    The sources are tried in order of reliability, and the first name found is
+    returned: the message fields, the file URL, the message text and, failing
+    those, the file ID.
+
+    Args:
+        message (Dict): The details of the message the file is attached to.
+        file_url (str): URL of the file.
+        file_id (str): ID of the file.
+
+    Returns:
+        str: The filename.
+    """
+    filename = _find_filename(message)
+    if filename:
+        return filename
+
+    # The URL might contain the filename in the path
+    url_filename_match = _URL_FILENAME_RE.search(file_url)
+    if url_filename_match:
+        return url_filename_match.group(1)
+
+    text = message.get("text")
+    return (text and _filename_from_text(text)) or file_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _filename_from_text(text: str) -> Optional[str]:
+    """Find a filename mentioned in the text of a message.
+
+    Bots tend to post uploads with the same templated text, so the results are
+    cached.
+
+    Args:
+        text (str): The text of the message.
+
+    Returns:
+        Optional[str]: The first filename matched by _FILENAME_TEXT_RES, or None.
+    """
+    # Look for patterns like "filename: something.txt" or "uploaded: something.txt"
+    for pattern in _FILENAME_TEXT_RES:
+        filename_match = pattern.search(text)
+        if filename_match:
+            return filename_match.group(1)
+    return None
+
+
+def _index_files(files: List[Dict]) -> Dict[str, Dict]:
+    """Index a room's files by casefolded filename and file ID.
+
+    Filenames take precedence over IDs, and earlier files over later ones.
+
+    Args:
+        files (List[Dict]): The files in the room, as returned by list_files.
+
+    Returns:
+        Dict[str, Dict]: A dictionary mapping casefolded filenames and IDs to files.
+    """
+    index = {}
+    for file_info in reversed(files):
+        if "id" in file_info:
+            index[file_info["id"].casefold()] = file_info
+    for file_info in reversed(files):
+        index[file_info["filename"].casefold()] = file_info
+    return index
+
+
+def _find_listed_file(files: List[Dict], file_index: Dict[str, Dict], filename: str) -> Dict:
+    """Find a file in a room's file list by name or ID.
+
+    The file is looked up by exact name or ID first, then by a partial match
+    against its URL or filename. Matching is case-insensitive.
+
+    Args:
+        files (List[Dict]): The files in the room, as returned by list_files.
+        file_index (Dict[str, Dict]): The files indexed by _index_files.
+        filename (str): Name or ID of the file to find.
+
+    Returns:
+        Dict: The file information. See list_files.
+
+    Raises:
+        FileNotFoundError: If the specified file is not in the list.
+    """
+    wanted = filename.casefold()
+    file_info = file_index.get(wanted)
+    if file_info is None:
+        file_info = next(
+            (
+                info
+                for info in files
+                if wanted in info["url"].casefold() or wanted in info["filename"].casefold()
+            ),
+            None,
+        )
+
+    if file_info is None or not (file_info.get("downloadUrl") or file_info.get("url")):
+        raise FileNotFoundError(f"File not found in room: {filename}")
+    return file_info
+
+
+def _preallocate(f, size: int) -> None:
+    """Reserve disk space for a file that is about to be written.
+
+    Allocating the blocks up front avoids the filesystem growing the file on
+    every write. Where posix_fallocate isn't available (e.g. macOS, Windows)
+    or isn't supported by the filesystem, the file is extended with truncate.
+
+    Args:
+        f: The file object, opened for writing.
+        size (int): The expected size of the file in bytes.
+
+    Returns:
+        None
+    """
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except (AttributeError, OSError):
+        f.truncate(size)
+
+
+def _details_from_headers(headers, all_headers: bool = False) -> Dict:
+    """Extract file information from the headers of a file response.
+
+    Args:
+        headers: The response headers.
+        all_headers (bool, optional): Whether to also include every other header,
+                                      with camelCase names. Defaults to False.
+
+    Returns:
+        Dict: A dictionary containing the name, contentType and size of the file,
+              where present.
+    """
+    # Extract information from headers
+    result = {}
+
+    # Get filename from Content-Disposition header
+    content_disposition = headers.get("Content-Disposition", "")
+    if "filename=" in content_disposition:
+        # Extract filename from Content-Disposition header
+        # Format is typically: attachment; filename="example.pdf"
+        _, _, tail = content_disposition.partition("filename=")
+        filename = tail.split(";", 1)[0].strip().strip("\"'")
+        if filename:
+            result["name"] = filename
+
+    # Get content type
+    content_type = headers.get("Content-Type", "")
+    if content_type:
+        result["contentType"] = content_type
+
+    # Get content length (file size)
+    content_length = headers.get("Content-Length", "")
+    if content_length and content_length.isdigit():
+        result["size"] = int(content_length)
+
+    # Add all other headers if the caller asked for them
+    if all_headers:
+        for header, value in headers.items():
+            # Convert header names to camelCase to match Webex API convention
+            camel_case_header = _to_camel_case(header)
+
+            # Add header to result if not already added
+            if camel_case_header not in result:
+                result[camel_case_header] = value
+
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _temp_download_dir() -> str:
+    """Get the temporary directory for downloads, creating it on first use.
+
+    Returns:
+        str: The path of the directory.
+    """
+    temp_dir = os.path.join(tempfile.gettempdir(), "webex-terminal")
+    os.makedirs(temp_dir, exist_ok=True)
+    return temp_dir
+
+
+def _resolve_save_path(filename: str, save_path: Optional[str]) -> Tuple[str, str]:
+    """Work out where to save a downloaded file.
+
+    Args:
+        filename (str): The name of the file.
+        save_path (Optional[str]): Path where the file should be saved. If it is a
+            directory the file is saved in it, and if not provided the file is
+            saved in the current directory.
+
+    Returns:
+        Tuple[str, str]: The filename made safe for the filesystem, and the path
+            to save the file to.
+    """
+    # Clean up the filename to make it safe for the filesystem
+    # Remove any characters that might cause issues in filenames
+    safe_filename = filename.translate(_UNSAFE_FILENAME_TABLE)
+
+    # Determine save path
+    if not save_path:
+        save_path = os.path.join(os.getcwd(), safe_filename)
+    else:
+        # If save_path is a directory, append the filename
+        if os.path.isdir(save_path):
+            save_path = os.path.join(save_path, safe_filename)
+
+    return safe_filename, save_path
+
+
+def _page_params(max_results: int):
+    """Get the query parameters for a list call with the given page size.
+
+    The shared read-only template is returned for the default page size, so
+    the common case does not allocate a new dictionary on every call.
+
+    Args:
+        max_results (int): Maximum number of items to request per page.
+
+    Returns:
+        Mapping[str, int]: The query parameters to send with the first page request.
+    """
+    if max_results == _DEFAULT_PAGE_SIZE:
+        return _DEFAULT_PAGE_PARAMS
+    return {"max": max_results}
+
 
 class WebexAPIError(Exception):
     """Exception raised for Webex API errors.
@@ -15,11 +373,58 @@ class WebexAPIError(Exception):
     This exception is raised when there is an error in the Webex API request,
     such as authentication failures, invalid requests, or server errors.
 
+    When raised for an error response, the response body is kept as raw bytes
+    and only parsed for the API's own error message the first time the message
+    is read, so errors that are caught and retried never decode the body.
+
     Attributes:
         message (str): The error message describing the API error.
+        status_code (Optional[int]): The HTTP status code of the failed response, if any.
+        retry_after (int): Seconds the API asked to wait before retrying (sent with
+            429 responses), or 0 if it did not say.
     """
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        content: Optional[bytes] = None,
+        retry_after: int = 0,
+    ):
+        """Initialize the exception.
+
+        Args:
+            message (str): The error message describing the API error.
+            status_code (Optional[int], optional): The HTTP status code of the failed
+                response. Defaults to None.
+            content (Optional[bytes], optional): The raw body of the failed response.
+                Defaults to None.
+            retry_after (int, optional): Seconds the API asked to wait before retrying.
+                Defaults to 0.
+
+        Returns:
+            None
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self._message = message
+        self._content = content
+
+    @property
+    def message(self) -> str:
+        """The error message, including the API's own message if the body has one."""
+        if self._content:
+            try:
+                error_data = _json_loads(self._content)
+                self._message = f"{self._message} - {error_data['message']}"
+            except (ValueError, KeyError, TypeError):
+                pass
+        self._content = None
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class WebexClient:
@@ -33,14 +438,48 @@ class WebexClient:
         config (dict): Configuration settings for the client.
         base_url (str): The base URL for the Webex API.
         session (requests.Session): A session object for making HTTP requests.
+        ROOM_CACHE_TTL (int): Seconds for which the room title index is reused.
+        TOKEN_REFRESH_MARGIN (int): Seconds before the token expires at which it is reloaded.
+        MAX_WORKERS (int): Number of threads used for concurrent lookups.
+        DOWNLOAD_CHUNK_SIZE (int): Bytes read and written per step when downloading files.
+        FILES_CACHE_TTL (int): Seconds for which the file list of a room is reused.
+        RANGE_DOWNLOAD_THRESHOLD (int): Size in bytes from which a download is split
+            into byte ranges fetched in parallel.
+        RANGE_DOWNLOAD_PARTS (int): Number of byte ranges a large download is split into.
+        PROGRESS_MIN_SIZE (int): Size in bytes from which downloads show a progress bar.
+        REQUESTS_PER_SECOND (float): Default sustained rate at which requests to the
+            API host are sent.
+        RATE_LIMIT_RETRIES (int): Number of times a rate-limited POST is sent again.
+        RATE_LIMIT_MAX_WAIT (int): Longest delay in seconds waited out before sending
+            a rate-limited POST again.
     """
 
-    def __init__(self):
+    ROOM_CACHE_TTL = 60
+    TOKEN_REFRESH_MARGIN = 60
+    MAX_WORKERS = 16
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    FILES_CACHE_TTL = 60
+    RANGE_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+    RANGE_DOWNLOAD_PARTS = 4
+    PROGRESS_MIN_SIZE = 1024 * 1024
+    REQUESTS_PER_SECOND = 10.0
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_MAX_WAIT = 30
+
+    def __init__(self, requests_per_second: Optional[float] = None):
         """Initialize the Webex API client.
 
         This method initializes the client by loading configuration settings,
         setting up the base URL for API requests, and creating a session object
-        for making HTTP requests.
+        for making HTTP requests. The session keeps a pool of persistent
+        connections to the Webex API and transparently retries idempotent
+        requests that fail with a rate limit or a transient server error.
+
+        Args:
+            requests_per_second (float, optional): Sustained rate at which requests
+                                                   to the API host are sent. Defaults
+                                                   to REQUESTS_PER_SECOND; 0 disables
+                                                   pacing.
 
         Returns:
             None
@@ -48,15 +487,87 @@ class WebexClient:
         self.config = load_config()
         self.base_url = self.config["api_base_url"]
         self.session = requests.Session()
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get the headers for API requests.
-
-        This method retrieves the authentication token and constructs the
-        headers needed for making authenticated requests to the Webex API.
+        self._auth_headers = None
+        self._token_expires_at = 0.0
+        # Held while the token is reloaded, so concurrent requests load it once
+        self._auth_lock = threading.Lock()
+
+        # Reuse connections across calls and back off on 429/5xx responses.
+        # POST is left out of the retry policy so messages are never sent twice,
+        # and because streamed upload bodies cannot be rewound for a resend.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE"]),
+            raise_on_status=False,
+        )
+        # The pool is sized for the client's own workers plus callers running
+        # lookups from other threads, so concurrent requests never wait for a
+        # free connection. Pools are kept for several hosts, since file downloads
+        # are served from content hosts other than the API.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=2 * self.MAX_WORKERS,
+            max_retries=retries,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Space API requests out so concurrent lookups don't run into the API's
+        # rate limit; a burst the size of the thread pool still goes out at once
+        if requests_per_second is None:
+            requests_per_second = self.REQUESTS_PER_SECOND
+        self._rate_limiter = None
+        if requests_per_second:
+            self._rate_limiter = TokenBucket(rate=requests_per_second, burst=self.MAX_WORKERS)
+
+        # Casefolded room title -> room, rebuilt from list_rooms() when stale
+        self._room_by_name_cache = None
+        self._room_cache_ts = 0.0
+
+        # Lookups by ID. Messages can be edited, so they are only reused for a
+        # minute; file details never change for a given ID, so they don't expire.
+        self._room_cache = TTLCache(maxsize=512, ttl=300)
+        self._person_cache = TTLCache(maxsize=512, ttl=300)
+        self._person_by_email_cache = TTLCache(maxsize=512, ttl=300)
+        self._message_cache = TTLCache(maxsize=512, ttl=60)
+        self._file_cache = TTLCache(maxsize=512, ttl=None)
+        # (room ID, page size) -> files listed in the room
+        self._files_cache = TTLCache(maxsize=32, ttl=self.FILES_CACHE_TTL)
+
+        # File IDs for which no endpoint returned details, retried after a minute
+        self._missing_file_cache = TTLCache(maxsize=512, ttl=60)
+        # The fallback endpoint that last returned file details, tried first
+        self._file_details_endpoint = None
+
+        # (URL, query parameters) -> (ETag, body) of GET responses, revalidated
+        # with If-None-Match so an unchanged resource comes back as an empty 304
+        self._etag_cache = TTLCache(maxsize=512, ttl=None)
+
+        # Shared pool for issuing independent read-only calls concurrently
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS
+        )
+        # Separate pool for the fallback probes of get_file_details, which run
+        # while a task on the shared pool waits for them
+        self._probe_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS
+        )
+
+    def _refresh_auth(self) -> None:
+        """Load the access token and attach the auth headers to the session.
+
+        This method retrieves the authentication token once and stores the
+        Authorization header on the session, so that every
+        subsequent request reuses them instead of looking up the token again.
+        It is called lazily before the first request, shortly before the token
+        expires, and whenever the API rejects the cached token with a 401 response.
+        If the token has changed, the cached API data is discarded, since the
+        new token may belong to another account.
 
         Returns:
-            Dict[str, str]: A dictionary containing the Authorization and Content-Type headers.
+            None
 
         Raises:
             WebexAPIError: If the user is not authenticated.
@@ -67,16 +578,85 @@ class WebexClient:
                 "Not authenticated. Please run 'webex-terminal auth' first."
             )
 
-        return {
-            "Authorization": f"Bearer {token_data['access_token']}",
-            "Content-Type": "application/json",
-        }
+        # Content-Type is set per request, so uploads and HEADs don't carry a JSON one
+        auth_headers = {"Authorization": f"Bearer {token_data['access_token']}"}
+        if self._auth_headers is not None and auth_headers != self._auth_headers:
+            self._clear_caches()
+        self._auth_headers = auth_headers
+        self.session.headers.update(self._auth_headers)
+
+        # Tokens without an expiry time are kept until the API rejects them
+        self._token_expires_at = token_data.get("expires_at") or float("inf")
+
+    def _clear_caches(self) -> None:
+        """Discard every cached API response.
+
+        Returns:
+            None
+        """
+        for cache in (
+            self._room_cache,
+            self._person_cache,
+            self._person_by_email_cache,
+            self._message_cache,
+            self._file_cache,
+            self._files_cache,
+            self._missing_file_cache,
+            self._etag_cache,
+        ):
+            cache.clear()
+        self._invalidate_room_cache()
+
+    def _ensure_auth(self) -> None:
+        """Make sure the session carries a current access token.
+
+        The cached token is reused until it is within TOKEN_REFRESH_MARGIN seconds
+        of its expiry time, so no token lookup happens on the request path. When
+        several threads find the token about to expire at once, one of them
+        reloads it and the others reuse the reloaded headers.
+
+        Returns:
+            None
+
+        Raises:
+            WebexAPIError: If the user is not authenticated.
+        """
+        def expiring() -> bool:
+            return (
+                self._auth_headers is None
+                or time.time() > self._token_expires_at - self.TOKEN_REFRESH_MARGIN
+            )
+
+        if expiring():
+            with self._auth_lock:
+                # Another thread may have reloaded the token while this one waited
+                if expiring():
+                    self._refresh_auth()
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get the headers for API requests.
+
+        This method returns the cached authentication headers, loading the
+        token on first use and again when it is about to expire.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the Authorization and Content-Type headers.
+
+        Raises:
+            WebexAPIError: If the user is not authenticated.
+        """
+        self._ensure_auth()
+
+        return {**self._auth_headers, "Content-Type": "application/json"}
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make a request to the Webex API.
 
         This method handles the details of making HTTP requests to the Webex API,
         including setting up headers, handling errors, and processing the response.
+        GET responses that carry an ETag are remembered, and the next GET for the
+        same URL sends it back in If-None-Match. When the API answers 304 Not
+        Modified, the remembered body is returned without downloading it again.
 
         Args:
             method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
@@ -89,40 +669,192 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the HTTP request or response.
         """
-        # Construct the URL manually to preserve case sensitivity
-        # The requests library might normalize URLs, which could include transforming to lowercase
+        # The endpoint is interpolated as-is; requests only normalizes the host,
+        # so case-sensitive IDs in the path are preserved
         url = f"{self.base_url}/{endpoint}"
-        headers = self._get_headers()
 
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        # Encode JSON bodies up front, so requests only has to send the bytes
+        if "json" in kwargs:
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **kwargs.get("headers", {})}
+
+        etag_key = None
+        cached = None
+        if method == "GET":
+            etag_key = (url, tuple(sorted((kwargs.get("params") or {}).items())))
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                kwargs["headers"] = {"If-None-Match": cached[0], **kwargs.get("headers", {})}
+
+        response = self._send(method, url, **kwargs)
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+
+        data = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if etag_key is not None and etag:
+            self._etag_cache.set(etag_key, (etag, data))
+        return data
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send an authenticated request to the Webex API.
+
+        Authentication headers live on the session, so only per-call overrides
+        need to be passed in. The token is loaded before the first request and
+        reloaded once if the API rejects it with a 401 response. Requests to the
+        API host are paced to the client's rate, while downloads from content
+        hosts are not. A POST rejected with a 429 response is sent again after
+        the delay given in its Retry-After header, unless that is longer than
+        RATE_LIMIT_MAX_WAIT; the 429 response is then returned, so the caller
+        isn't blocked and the error reports the delay. A streamed body (e.g. a file
+        upload) is only sent once, so on a 401 or 429 the response is returned
+        for the caller to retry with a fresh body.
+
+        Args:
+            method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
+            url (str): The full URL to request.
+            **kwargs: Additional arguments to pass to the requests library.
 
+        Returns:
+            requests.Response: The response from the API.
 
-        # Create a Request object
-        req = requests.Request(method, url, headers=headers, **kwargs)
+        Raises:
+            WebexAPIError: If the user is not authenticated or the request could not be sent.
+        """
+        self._ensure_auth()
+        sent_auth_headers = self._auth_headers
 
-        # Prepare the request
-        prepared_req = self.session.prepare_request(req)
+        # A streamed body is consumed by the first attempt and cannot be rewound
+        resendable = not hasattr(kwargs.get("data"), "read")
+        limiter = self._rate_limiter if url.startswith(self.base_url) else None
 
-        # Send the prepared request
-        response = self.session.send(prepared_req)
+        def send() -> requests.Response:
+            if limiter is not None:
+                limiter.acquire()
+            return self.session.request(method, url, **kwargs)
 
         try:
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP Error: {e}"
-            try:
-                error_data = response.json()
-                if "message" in error_data:
-                    error_msg = f"{error_msg} - {error_data['message']}"
-            except:
-                pass
-            raise WebexAPIError(error_msg)
+            response = send()
+
+            # If the cached token was rejected, reload it and try once more
+            if response.status_code == 401:
+                with self._auth_lock:
+                    # Skip the reload if another thread already replaced the token
+                    if self._auth_headers is sent_auth_headers:
+                        self._refresh_auth()
+                if resendable:
+                    response.close()
+                    response = send()
+
+            # The session's retry policy already waits out 429s for the other
+            # methods. A rate-limited POST was not processed, so it is safe to
+            # send again.
+            for attempt in range(self.RATE_LIMIT_RETRIES):
+                if response.status_code != 429 or method != "POST" or not resendable:
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+                if delay > self.RATE_LIMIT_MAX_WAIT:
+                    break
+                response.close()
+                time.sleep(delay)
+                response = send()
         except requests.exceptions.RequestException as e:
             raise WebexAPIError(f"Request Error: {e}")
+
+        return response
+
+    def _handle_response(self, response: requests.Response) -> Dict:
+        """Check a Webex API response for errors and decode its JSON body.
+
+        Args:
+            response (requests.Response): The response to process.
+
+        Returns:
+            Dict: The JSON response from the API as a dictionary, or an empty
+                dictionary if the body is not valid JSON.
+
+        Raises:
+            WebexAPIError: If the response has an error status code.
+        """
+        self._check_response(response)
+
+        try:
+            # Webex always returns UTF-8 JSON, so skip requests' charset detection
+            return _json_loads(response.content)
         except ValueError:
+            # An empty body (e.g. a 204) is not an error
             return {}
+        except requests.exceptions.RequestException as e:
+            raise WebexAPIError(f"Request Error: {e}")
+
+    def _check_response(self, response: requests.Response) -> None:
+        """Raise a WebexAPIError if a Webex API response has an error status code.
+
+        The error body is kept on the exception and only parsed if its message
+        is read.
+
+        Args:
+            response (requests.Response): The response to check.
+
+        Returns:
+            None
+
+        Raises:
+            WebexAPIError: If the response has an error status code.
+        """
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            retry_after = response.headers.get("Retry-After", "")
+            retry_after = int(retry_after) if retry_after.isdigit() else 0
+            message = f"HTTP Error: {e}"
+            if retry_after:
+                message += f" (retry after {retry_after} seconds)"
+            raise WebexAPIError(
+                message,
+                status_code=response.status_code,
+                content=response.content,
+                retry_after=retry_after,
+            )
+
+    def _paginate(self, url: str, params: Dict = None, item_key: str = "items") -> Iterator[Dict]:
+        """Iterate over the items of a paginated GET request to the Webex API.
+
+        This generator follows the "Link" header with rel="next" and yields the
+        items one at a time. The next page is only requested once the caller has
+        consumed the current one, so callers can start processing results early
+        and stopping iteration avoids fetching the remaining pages.
+
+        Args:
+            url (str): The full URL to request.
+            params (Dict, optional): Query parameters to include in the first request.
+            item_key (str, optional): The key in the response JSON that contains the items.
+                                     Defaults to "items".
+
+        Yields:
+            Dict: The next item from the paginated results.
+
+        Raises:
+            WebexAPIError: If there's an error with the HTTP request or response.
+        """
+        while url:
+            # Make the request
+            response = self._send("GET", url, params=params)
+            data = self._handle_response(response)
+
+            # If we can't parse the JSON, just stop with what we have
+            if not data:
+                return
+
+            yield from data.get(item_key, [])
+
+            # Follow the Link header to the next page, if there is one.
+            # requests parses the header (RFC 5988) into a dict keyed by rel.
+            url = response.links.get("next", {}).get("url")
+            if url:
+                # Clear params as they're already in the URL
+                params = {}
 
     def _paginated_get(self, url: str, params: Dict = None, item_key: str = "items", 
                        filter_func=None, max_items: int = None) -> List[Dict]:
@@ -152,65 +884,16 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the HTTP request or response.
         """
-        headers = self._get_headers()
-        all_items = []
-
-        while url:
-            # Make the request
-            response = self.session.get(url, headers=headers, params=params)
-
-            try:
-                response.raise_for_status()
-                data = response.json()
-                items = data.get(item_key, [])
-
-                # Apply filter if provided
-                if filter_func:
-                    items = [item for item in items if filter_func(item)]
+        items = self._paginate(url, params, item_key)
 
-                all_items.extend(items)
-
-                # Stop pagination if we've reached the maximum number of items
-                if max_items is not None and len(all_items) >= max_items:
-                    # Truncate the list to the exact number of items requested
-                    all_items = all_items[:max_items]
-                    break
-
-                # Check for Link header for pagination
-                link_header = response.headers.get("Link", "")
-                url = None
-
-                # Parse Link header to get next page URL
-                if link_header:
-                    links = link_header.split(",")
-                    for link in links:
-                        if 'rel="next"' in link:
-                            # Extract URL from link
-                            url_match = re.search(r"<(.+?)>", link)
-                            if url_match:
-                                url = url_match.group(1)
-                                # Clear params as they're already in the URL
-                                params = {}
-                                break
-
-            except requests.exceptions.HTTPError as e:
-                error_msg = f"HTTP Error: {e}"
-                try:
-                    error_data = response.json()
-                    if "message" in error_data:
-                        error_msg = f"{error_msg} - {error_data['message']}"
-                except:
-                    pass
-                raise WebexAPIError(error_msg)
-            except requests.exceptions.RequestException as e:
-                raise WebexAPIError(f"Request Error: {e}")
-            except ValueError:
-                # If we can't parse the JSON, just continue with what we have
-                break
+        # Apply filter if provided
+        if filter_func:
+            items = filter(filter_func, items)
 
-        return all_items
+        # Stop pagination once we've reached the maximum number of items
+        return list(itertools.islice(items, max_items))
 
-    def _head_request(self, endpoint: str, **kwargs) -> Dict:
+    def _head_request(self, endpoint: str, all_headers: bool = False, **kwargs) -> Dict:
         """Make a HEAD request to the Webex API and extract information from headers.
 
         This method handles the details of making HEAD requests to the Webex API,
@@ -219,71 +902,48 @@ class WebexClient:
 
         Args:
             endpoint (str): The API endpoint to call, relative to the base URL.
+            all_headers (bool, optional): Whether to also include every other response
+                                          header, with camelCase names. Defaults to False.
             **kwargs: Additional arguments to pass to the requests library.
 
         Returns:
-            Dict: A dictionary containing information extracted from the response headers.
+            Dict: A dictionary containing the name, contentType and size extracted from
+                  the response headers, where present.
 
         Raises:
             WebexAPIError: If there's an error with the HTTP request or response.
         """
         # Construct the URL manually to preserve case sensitivity
         url = f"{self.base_url}/{endpoint}"
-        headers = self._get_headers()
 
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        # Make the HEAD request, streamed and closed on exit so the connection goes
+        # straight back to the pool instead of waiting for an empty body to be read
+        kwargs.setdefault("stream", True)
+        with self._send("HEAD", url, **kwargs) as response:
+            self._check_response(response)
+            return _details_from_headers(response.headers, all_headers)
 
-        try:
-            # Make the HEAD request
-            response = self.session.head(url, headers=headers, **kwargs)
-            response.raise_for_status()
+    def multi_get(self, calls: List[Tuple[Callable, ...]]) -> List[Any]:
+        """Run several independent read-only API calls concurrently.
 
-            # Extract information from headers
-            result = {}
+        Each call is a tuple of a client method followed by its positional
+        arguments, e.g. ``(client.get_room, room_id)``. The calls run on a shared
+        thread pool and reuse the session's connection pool, so the total wait
+        is roughly that of the slowest call rather than the sum of all of them.
+        Methods that use the pool themselves, such as list_files, must not be
+        passed here, since they would wait on the pool from inside it.
 
-            # Get filename from Content-Disposition header
-            content_disposition = response.headers.get("Content-Disposition", "")
-            if "filename=" in content_disposition:
-                # Extract filename from Content-Disposition header
-                # Format is typically: attachment; filename="example.pdf"
-                filename_match = re.search(
-                    r'filename=["\']?([^"\';\n]+)["\']?', content_disposition
-                )
-                if filename_match:
-                    result["name"] = filename_match.group(1)
-
-            # Get content type
-            content_type = response.headers.get("Content-Type", "")
-            if content_type:
-                result["contentType"] = content_type
-
-            # Get content length (file size)
-            content_length = response.headers.get("Content-Length", "")
-            if content_length and content_length.isdigit():
-                result["size"] = int(content_length)
-
-            # Add all other headers that might be useful
-            for header, value in response.headers.items():
-                # Convert header names to camelCase to match Webex API convention
-                header_parts = header.split("-")
-                camel_case_header = header_parts[0].lower() + "".join(
-                    part.capitalize() for part in header_parts[1:]
-                )
-
-                # Add header to result if not already added
-                if camel_case_header not in result:
-                    result[camel_case_header] = value
+        Args:
+            calls (List[Tuple[Callable, ...]]): The calls to make.
 
-            return result
+        Returns:
+            List[Any]: The result of each call, in the same order as ``calls``.
 
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP Error: {e}"
-            raise WebexAPIError(error_msg)
-        except requests.exceptions.RequestException as e:
-            raise WebexAPIError(f"Request Error: {e}")
-        except Exception as e:
-            raise WebexAPIError(f"Unexpected error: {e}")
+        Raises:
+            WebexAPIError: If any of the calls fails.
+        """
+        futures = [self._executor.submit(func, *args) for func, *args in calls]
+        return [future.result() for future in futures]
 
     def get_me(self) -> Dict:
         """Get information about the authenticated user.
@@ -318,25 +978,43 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
-        params = {"max": max_results}
-
-        # Use the paginated_get helper method
-        url = f"{self.base_url}/rooms"
-
         # Get all rooms first
-        rooms = self._paginated_get(url, params)
+        rooms = list(self.iter_rooms(max_results))
+
+        # The full list is fetched either way, so refresh the title index for get_room_by_name
+        self._index_rooms(rooms)
 
         # Filter by title if needed (client-side filtering)
         if title_contains:
-            return [room for room in rooms if title_contains.lower() in room['title'].lower()]
+            needle = title_contains.casefold()
+            return [room for room in rooms if needle in room['title'].casefold()]
 
         return rooms
 
+    def iter_rooms(self, max_results: int = 100) -> Iterator[Dict]:
+        """Iterate over all rooms the user is a member of.
+
+        This method is the streaming counterpart of list_rooms. Rooms are yielded
+        as each page arrives, and the next page is only requested once the
+        current one has been consumed.
+
+        Args:
+            max_results (int, optional): Maximum number of rooms to request per page. Defaults to 100.
+
+        Yields:
+            Dict: A dictionary containing information about a room.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        params = _page_params(max_results)
+        return self._paginate(f"{self.base_url}/rooms", params)
+
     def get_room(self, room_id: str) -> Dict:
         """Get details for a specific room.
 
         This method retrieves detailed information about a specific Webex room
-        identified by its ID.
+        identified by its ID. Results are cached for five minutes.
 
         Args:
             room_id (str): ID of the room to retrieve information for.
@@ -347,15 +1025,22 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request or if the room doesn't exist.
         """
-        # Ensure the room_id is used as-is, without any transformation
-        # This is important because Webex room IDs are case-sensitive
-        return self._request("GET", f"rooms/{room_id}")
+        room = self._room_cache.get(room_id)
+        if room is None:
+            # Ensure the room_id is used as-is, without any transformation
+            # This is important because Webex room IDs are case-sensitive
+            room = self._request("GET", f"rooms/{room_id}")
+            self._room_cache.set(room_id, room)
+        return room
 
     def get_room_by_name(self, name: str) -> Optional[Dict]:
         """Find a room by name.
 
         This method searches for a Webex room with the specified name.
-        The search is case-insensitive.
+        The search is case-insensitive and is answered from an index of room
+        titles while it is less than ROOM_CACHE_TTL seconds old. Otherwise the
+        rooms are scanned page by page, stopping at the first match, and the
+        index is rebuilt when the scan reaches the end of the list.
 
         Args:
             name (str): Name of the room to find.
@@ -367,15 +1052,53 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
-        # Use the title_contains parameter for client-side filtering to narrow down the results
-        rooms = self.list_rooms(title_contains=name)
-
-        # Then find the exact match (case-insensitive)
-        for room in rooms:
-            if room["title"].lower() == name.lower():
+        # casefold() also matches titles that differ beyond ASCII case, e.g. "ß" and "SS"
+        target = name.casefold()
+
+        # Answer from the title index while it is fresh
+        if (
+            self._room_by_name_cache is not None
+            and time.time() - self._room_cache_ts <= self.ROOM_CACHE_TTL
+        ):
+            return self._room_by_name_cache.get(target)
+
+        # Otherwise look for the exact match (case-insensitive) as the pages
+        # arrive, so a room near the top of the list costs a single request
+        rooms = []
+        for room in self.iter_rooms():
+            if room["title"].casefold() == target:
                 return room
+            rooms.append(room)
+
+        # The whole list was fetched without a match, so index it for next time
+        self._index_rooms(rooms)
         return None
 
+    def _index_rooms(self, rooms: List[Dict]) -> None:
+        """Build the casefolded title index used by get_room_by_name.
+
+        Rooms are indexed in reverse so that, when several rooms share a
+        title, the first one returned by the API wins.
+
+        Args:
+            rooms (List[Dict]): The complete list of rooms the user is a member of.
+
+        Returns:
+            None
+        """
+        self._room_by_name_cache = {
+            room["title"].casefold(): room for room in reversed(rooms)
+        }
+        self._room_cache_ts = time.time()
+
+    def _invalidate_room_cache(self) -> None:
+        """Discard the room title index so the next lookup refetches the rooms.
+
+        Returns:
+            None
+        """
+        self._room_by_name_cache = None
+
     def search_rooms_by_name(self, name: str) -> List[Dict]:
         """Search for rooms by partial name.
 
@@ -447,25 +1170,45 @@ class WebexClient:
         Returns:
             List[Dict]: A list of dictionaries, each containing information about a message.
 
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        # Use a page size that doesn't exceed max_results
+        messages = self.iter_messages(room_id, page_size=min(50, max_results))
+
+        return list(itertools.islice(messages, max_results))
+
+    def iter_messages(self, room_id: str, page_size: int = 50) -> Iterator[Dict]:
+        """Iterate over the messages in a room.
+
+        This method is the streaming counterpart of list_messages. Messages are
+        yielded in reverse chronological order (newest first) as each page
+        arrives, so callers can stop as soon as they have seen enough.
+
+        Args:
+            room_id (str): ID of the room to retrieve messages from.
+            page_size (int, optional): Number of messages to request per page. Defaults to 50.
+
+        Yields:
+            Dict: A dictionary containing information about a message.
+
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
         params = {
             "roomId": room_id,
-            "max": min(50, max_results),  # Use a page size that doesn't exceed max_results
+            "max": page_size,
         }
 
-        # Use the paginated_get helper method with max_items parameter
         url = f"{self.base_url}/messages"
-        messages = self._paginated_get(url, params, max_items=max_results)
-
-        return messages
+        return self._paginate(url, params)
 
     def get_message(self, message_id: str) -> Dict:
         """Get details for a specific message.
 
         This method retrieves detailed information about a specific Webex message
-        identified by its ID.
+        identified by its ID. Messages can be edited, so results are only cached
+        for a minute, and until the message is deleted.
 
         Args:
             message_id (str): ID of the message to retrieve information for.
@@ -476,7 +1219,11 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request or if the message doesn't exist.
         """
-        return self._request("GET", f"messages/{message_id}")
+        message = self._message_cache.get(message_id)
+        if message is None:
+            message = self._request("GET", f"messages/{message_id}")
+            self._message_cache.set(message_id, message)
+        return message
 
     def delete_message(self, message_id: str) -> None:
         """Delete a message.
@@ -495,6 +1242,10 @@ class WebexClient:
                           or if the user doesn't have permission to delete the message.
         """
         self._request("DELETE", f"messages/{message_id}")
+        self._message_cache.pop(message_id)
+
+        # The message may have had files attached
+        self._files_cache.clear()
 
     def list_people(
         self,
@@ -533,7 +1284,7 @@ class WebexClient:
         """Get details for a specific person.
 
         This method retrieves detailed information about a specific Webex user
-        identified by their ID.
+        identified by their ID. Results are cached for five minutes.
 
         Args:
             person_id (str): ID of the person to retrieve information for.
@@ -544,12 +1295,18 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request or if the person doesn't exist.
         """
-        return self._request("GET", f"people/{person_id}")
+        person = self._person_cache.get(person_id)
+        if person is None:
+            person = self._request("GET", f"people/{person_id}")
+            self._person_cache.set(person_id, person)
+        return person
 
     def get_person_by_email(self, email: str) -> Optional[Dict]:
         """Find a person by email address.
 
         This method searches for a Webex user with the specified email address.
+        People that are found are cached by lowercase email address for a short
+        time, so repeated lookups of the same address don't hit the API.
 
         Args:
             email (str): Email address of the person to find.
@@ -561,8 +1318,14 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
+        key = email.lower()
+        person = self._person_by_email_cache.get(key)
+        if person is not None:
+            return person
+
         people = self.list_people(email=email)
         if people:
+            self._person_by_email_cache.set(key, people[0])
             return people[0]
         return None
 
@@ -611,6 +1374,7 @@ class WebexClient:
             "personEmail": email,
         }
         response = self._request("POST", "memberships", json=data)
+        self._invalidate_room_cache()
         return response
 
     def create_message_with_file(
@@ -633,62 +1397,58 @@ class WebexClient:
             WebexAPIError: If there's an error with the API request or if the file doesn't exist.
             FileNotFoundError: If the specified file doesn't exist.
         """
-        import os
-
         # Check if file exists
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Prepare the file for upload
-        file_name = os.path.basename(file_path)
-        files = {
-            "files": (file_name, open(file_path, "rb"), "application/octet-stream")
-        }
-
         # Prepare the data payload
-        data = {
+        fields = {
             "roomId": room_id,
         }
 
         # Add text if provided
         if text:
-            data["text"] = text
-
-        # Get headers without Content-Type as it will be set by the multipart request
-        headers = self._get_headers()
-        headers.pop("Content-Type", None)
+            fields["text"] = text
 
-        # Make the request
+        # Make the request, streaming the file from disk instead of buffering it in memory
+        file_name = os.path.basename(file_path)
         url = f"{self.base_url}/messages"
-        response = self.session.post(url, headers=headers, data=data, files=files)
+        with open(file_path, "rb") as file_obj:
+            for attempt in range(2):
+                file_obj.seek(0)
+                fields["files"] = (file_name, file_obj, "application/octet-stream")
+                encoder = MultipartEncoder(fields=fields)
+                headers = {"Content-Type": encoder.content_type}
+                response = self._send("POST", url, headers=headers, data=encoder)
+
+                # _send reloads a rejected token but can't resend the streamed
+                # body, so upload once more from the start of the file
+                if response.status_code != 401 or attempt:
+                    break
+                response.close()
 
-        try:
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP Error: {e}"
-            try:
-                error_data = response.json()
-                if "message" in error_data:
-                    error_msg = f"{error_msg} - {error_data['message']}"
-            except:
-                pass
-            raise WebexAPIError(error_msg)
-        except requests.exceptions.RequestException as e:
-            raise WebexAPIError(f"Request Error: {e}")
-        except ValueError:
-            return {}
+        message = self._handle_response(response)
+        self._files_cache.clear()
+        return message
 
-    def list_files(self, room_id: str, max_results: int = 100) -> List[Dict]:
+    def list_files(self, room_id: str, max_results: int = 100, refresh: bool = False) -> List[Dict]:
         """List files available in a room.
 
         This method retrieves a list of all files that have been shared in a room.
         It handles pagination automatically to retrieve all messages with file attachments.
+        The file URLs listed with each message are used directly, and any remaining
+        message and file details are fetched concurrently on the client's thread
+        pool, so the lookups cost a few round-trips rather than two per file.
+        The list is reused for FILES_CACHE_TTL seconds, so downloading several
+        files from a room doesn't scan its history each time.
 
         Args:
             room_id (str): ID of the room to search for files.
             max_results (int, optional): Maximum number of messages to retrieve per page. Defaults to 100.
                                         This parameter is passed to the list_messages method.
+            refresh (bool, optional): Whether to ignore the cached list and the cached
+                                      details of its files, and fetch them again.
+                                      Defaults to False.
 
         Returns:
             List[Dict]: A list of dictionaries, each containing information about a file.
@@ -699,192 +1459,111 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
+        key = (room_id, max_results)
+        if not refresh:
+            files = self._files_cache.get(key)
+            if files is not None:
+                return list(files)
+
         # Get all messages in the room (list_messages now handles pagination)
         messages = self.list_messages(room_id, max_results=max_results)
 
-        # List to store file information
-        files = []
-
-        # Search for messages with file attachments
-        for message in messages:
+        # Messages from list_messages already carry their file URLs, so only
+        # fetch the full details of a message when its file list is empty
+        candidates = [message for message in messages if "files" in message]
+        details = self._executor.map(
+            lambda message: message if message["files"] else self.get_message(message["id"]),
+            candidates,
+        )
+
+        # Collect the file URLs of each message, with the file ID (the last part of the URL)
+        pending = []
+        for message, message_details in zip(candidates, details):
             # Check if the message has files
-            if "files" in message:
-                # Get the message details to get file information
-                message_details = self.get_message(message["id"])
-
-                # Check if the message has files
-                if "files" in message_details:
-                    for file_url in message_details["files"]:
-                        if isinstance(file_url, str):
-                            # Extract file ID from URL (the last part of the URL)
-                            file_id = file_url.split("/")[-1]
-
-                            # Get file details from the API
-                            try:
-                                file_details = self.get_file_details(file_id)
-
-                                # Check if file_details is empty
-                                if file_details:
-                                    # Create a file info dictionary with all the details
-                                    file_info = {
-                                        "filename": file_details.get("name", file_id),
-                                        "url": file_url,
-                                        "message_id": message["id"],
-                                        "id": file_id,
-                                        "contentType": file_details.get("contentType"),
-                                        "size": file_details.get("size"),
-                                        "created": file_details.get("created"),
-                                        "creatorId": file_details.get("creatorId"),
-                                        "downloadUrl": file_details.get("downloadUrl"),
-                                    }
-
-                                    # Add any other fields from file_details to file_info
-                                    for key, value in file_details.items():
-                                        if key not in file_info:
-                                            file_info[key] = value
-
-                                    # Add file info to the list
-                                    files.append(file_info)
-                                else:
-                                    # If file_details is empty, fall back to the old method
-                                    # but don't raise an exception
-                                    raise WebexAPIError("Empty file details")
-                            except WebexAPIError:
-                                # If we can't get file details, fall back to the old method
-                                import re
-
-                                # Look for actual filename in message details
-                                # Check common fields that might contain the filename
-                                actual_filename = None
-
-                                # Check if there's a 'fileName' field in the message
-                                if "fileName" in message_details:
-                                    actual_filename = message_details["fileName"]
-                                # Check if there's a 'content' field with filename info
-                                elif "content" in message_details and isinstance(
-                                    message_details["content"], dict
-                                ):
-                                    if "fileName" in message_details["content"]:
-                                        actual_filename = message_details["content"][
-                                            "fileName"
-                                        ]
-                                    elif "name" in message_details["content"]:
-                                        actual_filename = message_details["content"][
-                                            "name"
-                                        ]
-                                    # Check for files array in content
-                                    elif "files" in message_details[
-                                        "content"
-                                    ] and isinstance(
-                                        message_details["content"]["files"], list
-                                    ):
-                                        for file_item in message_details["content"][
-                                            "files"
-                                        ]:
-                                            if isinstance(file_item, dict):
-                                                if "name" in file_item:
-                                                    actual_filename = file_item["name"]
-                                                    break
-                                                elif "fileName" in file_item:
-                                                    actual_filename = file_item[
-                                                        "fileName"
-                                                    ]
-                                                    break
-                                                elif "displayName" in file_item:
-                                                    actual_filename = file_item[
-                                                        "displayName"
-                                                    ]
-                                                    break
-                                # Check if there's an 'attachments' field
-                                elif "attachments" in message_details and isinstance(
-                                    message_details["attachments"], list
-                                ):
-                                    for attachment in message_details["attachments"]:
-                                        if isinstance(attachment, dict):
-                                            if "fileName" in attachment:
-                                                actual_filename = attachment["fileName"]
-                                                break
-                                            elif "name" in attachment:
-                                                actual_filename = attachment["name"]
-                                                break
-                                            elif "contentName" in attachment:
-                                                actual_filename = attachment[
-                                                    "contentName"
-                                                ]
-                                                break
-                                            elif "displayName" in attachment:
-                                                actual_filename = attachment[
-                                                    "displayName"
-                                                ]
-                                                break
-                                            # Check for content field in attachment
-                                            elif "content" in attachment and isinstance(
-                                                attachment["content"], dict
-                                            ):
-                                                if "fileName" in attachment["content"]:
-                                                    actual_filename = attachment[
-                                                        "content"
-                                                    ]["fileName"]
-                                                    break
-                                                elif "name" in attachment["content"]:
-                                                    actual_filename = attachment[
-                                                        "content"
-                                                    ]["name"]
-                                                    break
-
-                                # Try to extract filename from the URL path
-                                if not actual_filename:
-                                    # The URL might contain the filename in the path
-                                    url_filename_match = re.search(
-                                        r"/([^/]+\.[a-zA-Z0-9]+)(?:\?|$)",
-                                        file_url,
-                                        re.IGNORECASE,
-                                    )
-                                    if url_filename_match:
-                                        actual_filename = url_filename_match.group(1)
-
-                                # If we couldn't find the actual filename, try to extract it from the text
-                                if not actual_filename and "text" in message_details:
-                                    # Look for patterns like "filename: something.txt" or "uploaded: something.txt"
-                                    text = message_details["text"]
-                                    # Try different patterns
-                                    filename_patterns = [
-                                        r"(?:filename|file|uploaded|attached):\s*([^\s]+\.[a-zA-Z0-9]+)",
-                                        r"uploaded\s+([^\s]+\.[a-zA-Z0-9]+)",
-                                        r"attached\s+([^\s]+\.[a-zA-Z0-9]+)",
-                                        r"file\s+([^\s]+\.[a-zA-Z0-9]+)",
-                                        r"([^\s]+\.[a-zA-Z0-9]{2,4})",  # Look for any word ending with a file extension
-                                    ]
-
-                                    for pattern in filename_patterns:
-                                        filename_match = re.search(
-                                            pattern, text, re.IGNORECASE
-                                        )
-                                        if filename_match:
-                                            actual_filename = filename_match.group(1)
-                                            break
-
-                                # If we still couldn't find the actual filename, use the file ID
-                                if not actual_filename:
-                                    actual_filename = file_id
-
-                                # Add file info to the list with limited information
-                                files.append(
-                                    {
-                                        "filename": actual_filename,
-                                        "url": file_url,
-                                        "message_id": message["id"],
-                                        "id": file_id,
-                                    }
-                                )
-
-        return files
+            if "files" in message_details:
+                for file_url in message_details["files"]:
+                    if isinstance(file_url, str):
+                        file_id = file_url.split("/")[-1]
+                        pending.append((message["id"], message_details, file_url, file_id))
+
+        # An explicit refresh looks the files up again, including those whose
+        # details were cached or could not be found a moment ago
+        file_ids = [file_id for _, _, _, file_id in pending]
+        if refresh:
+            for file_id in file_ids:
+                self._file_cache.pop(file_id, None)
+                self._missing_file_cache.pop(file_id, None)
+
+        # Look up the details of every file concurrently. A file can be attached
+        # to several messages (replies, re-shares), so each one is fetched once.
+        file_details = self.get_files_details_bulk(file_ids, fallback=True)
+
+        files = [
+            self._file_info(message_id, message_details, file_url, file_id, file_details[file_id])
+            for message_id, message_details, file_url, file_id in pending
+        ]
+        self._files_cache.set(key, files)
+        return list(files)
+
+    def _file_info(
+        self,
+        message_id: str,
+        message_details: Dict,
+        file_url: str,
+        file_id: str,
+        file_details: Dict,
+    ) -> Dict:
+        """Build the file information for one file attached to a message.
+
+        This method uses the file details from the API. If they are not
+        available, it falls back to finding the filename in the message itself.
+
+        Args:
+            message_id (str): ID of the message the file is attached to.
+            message_details (Dict): The full details of the message.
+            file_url (str): URL of the file.
+            file_id (str): ID of the file.
+            file_details (Dict): The file details returned by get_file_details.
+
+        Returns:
+            Dict: A dictionary containing information about the file. See list_files.
+        """
+        if file_details:
+            # Create a file info dictionary with all the details
+            file_info = {
+                "filename": file_details.get("name", file_id),
+                "url": file_url,
+                "message_id": message_id,
+                "id": file_id,
+                "contentType": file_details.get("contentType"),
+                "size": file_details.get("size"),
+                "created": file_details.get("created"),
+                "creatorId": file_details.get("creatorId"),
+                "downloadUrl": file_details.get("downloadUrl"),
+            }
+
+            # Add any other fields from file_details to file_info
+            for key, value in file_details.items():
+                if key not in file_info:
+                    file_info[key] = value
+
+            return file_info
+
+        # Return file info with limited information
+        return {
+            "filename": _extract_filename(message_details, file_url, file_id),
+            "url": file_url,
+            "message_id": message_id,
+            "id": file_id,
+        }
 
     def get_file_details(self, file_id: str) -> Dict:
         """Get details for a specific file.
 
         This method retrieves detailed information about a specific file
-        identified by its ID.
+        identified by its ID. File metadata cannot change for a given ID, so
+        results are cached. Lookups that find no details are remembered for a
+        short time, so the chain of fallback endpoints isn't retried on every call.
 
         Args:
             file_id (str): ID of the file to retrieve information for.
@@ -902,35 +1581,180 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request or if the file doesn't exist.
         """
-        # Use a HEAD request to get file details from headers
-        # According to Webex API documentation, this is the recommended way to get file details
+        file_details = self._file_cache.get(file_id)
+        if file_details is None:
+            if self._missing_file_cache.get(file_id):
+                return {}
+
+            file_details = self._fetch_file_details(file_id)
+            if file_details:
+                self._file_cache.set(file_id, file_details)
+            else:
+                self._missing_file_cache.set(file_id, True)
+        return file_details
+
+    def open_file(self, file_id: str) -> Tuple[Dict, requests.Response]:
+        """Get the details and the content of a file with a single request.
+
+        When a file is going to be downloaded anyway, this avoids the separate HEAD
+        request made by get_file_details: the details are read from the headers of
+        the streamed GET response. The caller must close the response, e.g. by
+        using it in a with block.
+
+        Args:
+            file_id (str): ID of the file to retrieve.
+
+        Returns:
+            Tuple[Dict, requests.Response]: The file details (see get_file_details)
+                and the streamed response for reading the file content.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request or if the file doesn't exist.
+        """
+        url = f"{self.base_url}/contents/{file_id}"
+        response = self._send("GET", url, headers=_IDENTITY_ENCODING, stream=True)
         try:
-            # Make a HEAD request to the contents endpoint
-            file_details = self._head_request(f"contents/{file_id}")
+            self._check_response(response)
+        except WebexAPIError:
+            response.close()
+            raise
+
+        file_details = _details_from_headers(response.headers)
+        file_details["downloadUrl"] = url
+        return file_details, response
+
+    def get_files_details_bulk(self, file_ids: List[str], fallback: bool = False) -> Dict[str, Dict]:
+        """Get details for several files concurrently.
+
+        This method looks up the files on the client's thread pool, so the cost is
+        a few round-trips rather than one per file. By default only the HEAD request
+        is made for each file, which is all that's needed for files the user can
+        access; set ``fallback`` to also try the other endpoints that
+        get_file_details falls back to.
+
+        Args:
+            file_ids (List[str]): IDs of the files to retrieve information for.
+            fallback (bool, optional): Whether to try the fallback endpoints for files
+                                       the HEAD request fails for. Defaults to False.
+
+        Returns:
+            Dict[str, Dict]: A dictionary mapping each file ID to its details, or to an
+                            empty dictionary if no details were found. See get_file_details.
+        """
+        lookup = self.get_file_details if fallback else self._get_file_details_from_head
+        file_ids = list(dict.fromkeys(file_ids))
+        return dict(zip(file_ids, self._executor.map(lookup, file_ids)))
+
+    def _get_file_details_from_head(self, file_id: str) -> Dict:
+        """Get the cached details for a file, or look them up with a HEAD request only.
+
+        Args:
+            file_id (str): ID of the file to retrieve information for.
 
-            # If we got file details, add the download URL
+        Returns:
+            Dict: A dictionary containing information about the file, or an empty
+                  dictionary if the HEAD request fails. See get_file_details.
+        """
+        file_details = self._file_cache.get(file_id)
+        if file_details is None:
+            try:
+                file_details = self._head_file_details(file_id)
+            except WebexAPIError:
+                return {}
             if file_details:
-                file_details["downloadUrl"] = f"{self.base_url}/contents/{file_id}"
+                self._file_cache.set(file_id, file_details)
+        return file_details
+
+    def _head_file_details(self, file_id: str) -> Dict:
+        """Get the details for a file from the headers of a HEAD request.
+
+        Args:
+            file_id (str): ID of the file to retrieve information for.
+
+        Returns:
+            Dict: A dictionary containing the name, contentType, size and downloadUrl
+                  of the file, where available.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        # Make a HEAD request to the contents endpoint
+        file_details = self._head_request(f"contents/{file_id}")
+
+        # If we got file details, add the download URL
+        if file_details:
+            file_details["downloadUrl"] = f"{self.base_url}/contents/{file_id}"
 
-            return file_details
-        except WebexAPIError as e:
-            # If HEAD request fails, try the traditional GET requests as fallback
+        return file_details
+
+    def _fetch_file_details(self, file_id: str) -> Dict:
+        """Fetch the details for a specific file from the API.
+
+        Args:
+            file_id (str): ID of the file to retrieve information for.
+
+        Returns:
+            Dict: A dictionary containing information about the file, or an empty
+                  dictionary if none of the endpoints return any. See get_file_details.
+        """
+        # Use a HEAD request to get file details from headers
+        # According to Webex API documentation, this is the recommended way to get file details
+        try:
+            return self._head_file_details(file_id)
+        except WebexAPIError:
+            pass
+
+        # If the HEAD request fails, try the traditional GET requests as fallback,
+        # starting with the endpoint that answered last time
+        endpoints = _FILE_DETAILS_ENDPOINTS
+        known_endpoint = self._file_details_endpoint
+        if known_endpoint is not None:
             try:
-                result = self._request("GET", f"contents/{file_id}")
+                result = self._request("GET", known_endpoint.format(file_id))
+            except WebexAPIError:
+                result = None
+            if result:
                 return result
-            except WebexAPIError as e:
-                # If that fails, try the attachment/actions endpoint
+            endpoints = tuple(e for e in endpoints if e != known_endpoint)
+
+        # The others are independent, so probe them all at once and take the first
+        # answer that has any details in it
+        futures = {
+            self._probe_executor.submit(self._request, "GET", endpoint.format(file_id)): endpoint
+            for endpoint in endpoints
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
                 try:
-                    result = self._request("GET", f"attachment/actions/{file_id}")
-                    return result
-                except WebexAPIError as e:
-                    # If that also fails, try the attachment endpoint
-                    try:
-                        result = self._request("GET", f"attachment/{file_id}")
-                        return result
-                    except WebexAPIError as e:
-                        # If all endpoints fail, return an empty dictionary
-                        return {}
+                    result = future.result()
+                except WebexAPIError:
+                    continue
+                # An empty or non-JSON body decodes to {}, which must not win
+                # over a slower probe that returns real details
+                if not result:
+                    continue
+                self._file_details_endpoint = futures[future]
+                return result
+        finally:
+            for future in futures:
+                future.cancel()
+
+        # GET contents/{id} returns the file itself, so it is kept out of the race
+        # and tried last: only its headers are read, and the body is never downloaded
+        url = f"{self.base_url}/contents/{file_id}"
+        try:
+            with self._send(
+                "GET", url, headers=_IDENTITY_ENCODING, stream=True
+            ) as response:
+                self._check_response(response)
+                file_details = _details_from_headers(response.headers)
+        except WebexAPIError:
+            # If all endpoints fail, return an empty dictionary
+            return {}
+
+        if file_details:
+            file_details["downloadUrl"] = url
+        return file_details
 
     def download_file_from_url(self, file_url: str, save_path: str = None) -> str:
         """Download a file directly from a URL.
@@ -950,47 +1774,193 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
-        import os
-        import tempfile
-        from tqdm import tqdm
-
-        # Get headers for authentication
-        headers = self._get_headers()
-
         # Determine save path
         if not save_path:
-            # Create a temporary directory if it doesn't exist
-            temp_dir = os.path.join(tempfile.gettempdir(), "webex-terminal")
-            os.makedirs(temp_dir, exist_ok=True)
+            temp_dir = _temp_download_dir()
 
             # Generate a unique filename based on the URL
-            import hashlib
-            filename = hashlib.md5(file_url.encode()).hexdigest()
+            filename = hashlib.blake2b(file_url.encode(), digest_size=16).hexdigest()
 
-            # Try to determine file extension from URL
-            if "." in file_url.split("/")[-1]:
-                ext = file_url.split("/")[-1].split(".")[-1]
-                filename = f"{filename}.{ext}"
+            # Keep the file extension from the URL path, if it has one
+            filename += posixpath.splitext(urllib.parse.urlsplit(file_url).path)[1]
 
             save_path = os.path.join(temp_dir, filename)
 
         # Download the file
-        response = self.session.get(file_url, headers=headers, stream=True)
-        response.raise_for_status()
+        return self._stream_to_file(file_url, save_path, f"Downloading {os.path.basename(save_path)}")
+
+    def _stream_to_file(self, url: str, save_path: str, desc: str, ranged: bool = True) -> str:
+        """Stream a file from a URL to disk, showing a progress bar.
+
+        Files of at least RANGE_DOWNLOAD_THRESHOLD bytes are split into byte ranges
+        that are downloaded in parallel, if the server supports range requests.
+        Files are requested without content encoding, so the Content-Length is the
+        size on disk and no decompression pass is needed.
+
+        Args:
+            url (str): URL of the file to download.
+            save_path (str): Path where the file should be saved.
+            desc (str): Description shown next to the progress bar.
+            ranged (bool, optional): Whether large files may be downloaded in parallel
+                                     byte ranges. Defaults to True.
+
+        Returns:
+            str: The path where the file was saved.
+
+        Raises:
+            requests.exceptions.HTTPError: If the server returns an error status code.
+            WebexAPIError: If the user is not authenticated or the request could not be sent.
+        """
+        # Download the file; the session already carries the auth header.
+        # Attachments are mostly compressed formats already, so ask for them as-is.
+        with self._send("GET", url, headers=_IDENTITY_ENCODING, stream=True) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get('content-length', 0))
+            if (
+                ranged
+                and hasattr(os, "pwrite")
+                and total_size >= self.RANGE_DOWNLOAD_THRESHOLD
+                and response.headers.get("Accept-Ranges") == "bytes"
+                and "Content-Encoding" not in response.headers
+            ):
+                try:
+                    return self._write_ranges(url, response, total_size, save_path, desc)
+                except WebexAPIError:
+                    # The server didn't honour the ranges, so download it in one piece
+                    pass
+            else:
+                return self._write_response(response, save_path, desc)
+
+        return self._stream_to_file(url, save_path, desc, ranged=False)
+
+    def _write_ranges(
+        self,
+        url: str,
+        response: requests.Response,
+        total_size: int,
+        save_path: str,
+        desc: str,
+    ) -> str:
+        """Download a file as byte ranges fetched in parallel, writing each in place.
+
+        The first range is read from the response that has already been opened,
+        and the others are requested with Range headers.
+
+        Args:
+            url (str): URL of the file to download.
+            response (requests.Response): The open, streamed response for the whole file.
+            total_size (int): The size of the file in bytes.
+            save_path (str): Path where the file should be saved.
+            desc (str): Description shown next to the progress bar.
+
+        Returns:
+            str: The path where the file was saved.
+
+        Raises:
+            requests.exceptions.HTTPError: If the server returns an error status code.
+            WebexAPIError: If the server doesn't return the requested ranges.
+        """
+        part_size = -(-total_size // self.RANGE_DOWNLOAD_PARTS)
+        ranges = [
+            (start, min(start + part_size, total_size))
+            for start in range(0, total_size, part_size)
+        ]
+        progress_lock = threading.Lock()
+
+        with open(save_path, "wb") as f, tqdm(
+            total=total_size,
+            desc=desc,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            disable=self._hide_progress(total_size),
+        ) as pbar:
+            _preallocate(f, total_size)
+            fd = f.fileno()
+
+            def fetch(start: int, end: int, part: Optional[requests.Response] = None) -> None:
+                if part is None:
+                    range_headers = {
+                        "Range": f"bytes={start}-{end - 1}",
+                        **_IDENTITY_ENCODING,
+                    }
+                    part = self._send("GET", url, headers=range_headers, stream=True)
+                with part:
+                    part.raise_for_status()
+                    if start and part.status_code != 206:
+                        raise WebexAPIError("Range requests are not supported for this file")
+
+                    offset = start
+                    while offset < end:
+                        chunk = part.raw.read(min(self.DOWNLOAD_CHUNK_SIZE, end - offset))
+                        if not chunk:
+                            raise WebexAPIError("Download ended before the end of the range")
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        with progress_lock:
+                            pbar.update(len(chunk))
+
+            # A pool of its own, since this may already run on the client's pool
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch, *ranges[0], response)]
+                futures += [executor.submit(fetch, start, end) for start, end in ranges[1:]]
+                for future in futures:
+                    future.result()
+
+        return save_path
+
+    def _hide_progress(self, total_size: int) -> bool:
+        """Check whether the progress bar should be hidden for a download.
+
+        The bar is only shown on an interactive terminal, and not for files known
+        to be smaller than PROGRESS_MIN_SIZE, which finish before it is useful.
+
+        Args:
+            total_size (int): The size of the file in bytes, or 0 if unknown.
+
+        Returns:
+            bool: True if the progress bar should be hidden.
+        """
+        return not sys.stderr.isatty() or 0 < total_size < self.PROGRESS_MIN_SIZE
 
+    def _write_response(self, response: requests.Response, save_path: str, desc: str) -> str:
+        """Write the body of a streamed response to disk, showing a progress bar.
+
+        Args:
+            response (requests.Response): The response, requested with stream=True.
+            save_path (str): Path where the file should be saved.
+            desc (str): Description shown next to the progress bar.
+
+        Returns:
+            str: The path where the file was saved.
+        """
         # Get file size from headers if available
         total_size = int(response.headers.get('content-length', 0))
 
-        # Create a progress bar
-        desc = f"Downloading {os.path.basename(save_path)}"
-
-        # Save the file with progress bar
+        # Copy the raw stream to disk in C, updating the progress bar per write.
+        # decode_content makes urllib3 undo any gzip/deflate encoding the server
+        # applied despite being asked for the identity encoding.
+        response.raw.decode_content = True
         with open(save_path, "wb") as f:
-            with tqdm(total=total_size, unit='B', unit_scale=True, desc=desc) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # filter out keep-alive new chunks
-                        f.write(chunk)
-                        pbar.update(len(chunk))
+            if total_size:
+                _preallocate(f, total_size)
+
+            with tqdm.wrapattr(
+                f,
+                "write",
+                total=total_size,
+                desc=desc,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+                disable=self._hide_progress(total_size),
+            ) as out:
+                shutil.copyfileobj(response.raw, out, self.DOWNLOAD_CHUNK_SIZE)
+
+            # Drop any preallocated space the body didn't fill (e.g. if it was
+            # decompressed to a different size than the Content-Length)
+            f.truncate()
 
         return save_path
 
@@ -1009,11 +1979,25 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
-        params = {"max": max_results}
+        return list(self.iter_teams(max_results))
 
-        # Use the paginated_get helper method
-        url = f"{self.base_url}/teams"
-        return self._paginated_get(url, params)
+    def iter_teams(self, max_results: int = 100) -> Iterator[Dict]:
+        """Iterate over all teams the user is a member of.
+
+        This method is the streaming counterpart of list_teams. Teams are yielded
+        as each page arrives, so callers can stop early without fetching the rest.
+
+        Args:
+            max_results (int, optional): Maximum number of teams to request per page. Defaults to 100.
+
+        Yields:
+            Dict: A dictionary containing information about a team.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        params = _page_params(max_results)
+        return self._paginate(f"{self.base_url}/teams", params)
 
     def list_team_rooms(self, team_id: str, max_results: int = 100) -> List[Dict]:
         """List all rooms (spaces) in a specific team.
@@ -1031,25 +2015,39 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request.
         """
-        # Use the Webex API to get rooms filtered by teamId
+        return list(self.iter_team_rooms(team_id, max_results))
+
+    def iter_team_rooms(self, team_id: str, max_results: int = 100) -> Iterator[Dict]:
+        """Iterate over all rooms (spaces) in a specific team.
+
+        This method is the streaming counterpart of list_team_rooms. Rooms are
+        yielded as each page arrives, so callers can stop early without fetching the rest.
+
+        Args:
+            team_id (str): ID of the team to retrieve rooms for.
+            max_results (int, optional): Maximum number of rooms to request per page. Defaults to 100.
+
+        Yields:
+            Dict: A dictionary containing information about a room.
+
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+        """
+        # Use the Webex API to get rooms filtered by teamId; the API already
+        # filters them, so the rooms are returned as-is
         params = {
             "teamId": team_id,
             "max": max_results
         }
-
-        # Define a filter function to ensure we only return rooms that are actually part of the team
-        def filter_team_rooms(room):
-            return room.get('teamId') == team_id
-
-        # Use the paginated_get helper method with the filter function
-        url = f"{self.base_url}/rooms"
-        return self._paginated_get(url, params, filter_func=filter_team_rooms)
+        return self._paginate(f"{self.base_url}/rooms", params)
 
     def remove_user_from_room(self, room_id: str, email: str) -> Dict:
         """Remove a user from a room.
 
         This method removes a user from a specified Webex room using their email address.
         It first finds the membership ID for the user in the room, then deletes that membership.
+        The membership is looked up with the API's personEmail filter; the room's
+        members are only scanned if the filtered lookup returns nothing.
 
         Args:
             room_id (str): ID of the room to remove the user from.
@@ -1061,21 +2059,34 @@ class WebexClient:
         Raises:
             WebexAPIError: If there's an error with the API request or if the user is not found in the room.
         """
-        # Get all memberships for the room
-        memberships = self.list_room_members(room_id)
+        # Ask the API for the membership of this email only
+        result = self._request(
+            "GET", "memberships", params={"roomId": room_id, "personEmail": email}
+        )
+        membership = next(iter(result.get("items", [])), None)
+
+        # Fall back to scanning the members, stopping at the first match, in
+        # case the filter missed an address stored with different case
+        if membership is None:
+            target = email.lower()
+            params = {"roomId": room_id, "max": _DEFAULT_PAGE_SIZE}
+            membership = next(
+                (
+                    member
+                    for member in self._paginate(f"{self.base_url}/memberships", params)
+                    if member.get("personEmail", "").lower() == target
+                ),
+                None,
+            )
 
-        # Find the membership for the specified email
-        membership_id = None
-        for membership in memberships:
-            if membership.get("personEmail", "").lower() == email.lower():
-                membership_id = membership.get("id")
-                break
+        membership_id = membership.get("id") if membership else None
 
         if not membership_id:
             raise WebexAPIError(f"User with email '{email}' not found in the room.")
 
         # Delete the membership
         response = self._request("DELETE", f"memberships/{membership_id}")
+        self._invalidate_room_cache()
         return response
 
     def list_room_tabs(self, room_id: str) -> List[Dict]:
@@ -1118,86 +2129,124 @@ class WebexClient:
             WebexAPIError: If there's an error with the API request.
             FileNotFoundError: If the specified file is not found in the room.
         """
-        import os
-        from tqdm import tqdm
-
         # Get list of files in the room
         files = self.list_files(room_id)
 
-        # Search for the file by name or ID
-        file_url = None
-        download_url = None
-        actual_filename = None
-        for file_info in files:
-            # Check if the filename matches exactly (case-insensitive)
-            if file_info["filename"].lower() == filename.lower():
-                file_url = file_info["url"]
-                download_url = file_info.get("downloadUrl")
-                actual_filename = file_info["filename"]
-                break
-            # Check if the filename is contained in the file URL
-            elif filename.lower() in file_info["url"].lower():
-                file_url = file_info["url"]
-                download_url = file_info.get("downloadUrl")
-                actual_filename = file_info["filename"]
-                break
-            # Check if the filename matches the file ID
-            elif "id" in file_info and file_info["id"].lower() == filename.lower():
-                file_url = file_info["url"]
-                download_url = file_info.get("downloadUrl")
-                actual_filename = file_info["filename"]
-                break
-            # Check if the filename is a substring of the actual filename (case-insensitive)
-            elif filename.lower() in file_info["filename"].lower():
-                file_url = file_info["url"]
-                download_url = file_info.get("downloadUrl")
-                actual_filename = file_info["filename"]
-                break
-
-        # If file not found, raise an error
-        if not file_url and not download_url:
-            raise FileNotFoundError(f"File not found in room: {filename}")
+        try:
+            file_info = _find_listed_file(files, _index_files(files), filename)
+        except FileNotFoundError:
+            # The cached list may predate the file being shared, so look again
+            files = self.list_files(room_id, refresh=True)
+            file_info = _find_listed_file(files, _index_files(files), filename)
 
         # Use the actual filename for saving the file
-        if not actual_filename:
-            actual_filename = filename
+        safe_filename, save_path = _resolve_save_path(file_info["filename"] or filename, save_path)
+        return self._download_listed_file(file_info, safe_filename, save_path)
 
-        # Clean up the filename to make it safe for the filesystem
-        # Remove any characters that might cause issues in filenames
-        import re
+    def download_file_by_id(self, file_id: str, save_path: str = None) -> str:
+        """Download a file by its ID.
 
-        safe_filename = re.sub(r'[\\/*?:"<>|]', "_", actual_filename)
+        Unlike download_file, this method doesn't need to list the files in a room
+        first: the filename and the content come from a single request.
 
-        # Determine save path
-        if not save_path:
-            save_path = os.path.join(os.getcwd(), safe_filename)
-        else:
-            # If save_path is a directory, append the filename
-            if os.path.isdir(save_path):
-                save_path = os.path.join(save_path, safe_filename)
+        Args:
+            file_id (str): ID of the file to download.
+            save_path (str, optional): Path where the file should be saved.
+                                      If not provided, the file will be saved
+                                      in the current directory.
 
-        # Get headers for authentication
-        headers = self._get_headers()
+        Returns:
+            str: The path where the file was saved.
 
-        # Use download_url if available, otherwise use file_url
-        url_to_use = download_url if download_url else file_url
+        Raises:
+            WebexAPIError: If there's an error with the API request or if the file doesn't exist.
+        """
+        file_details, response = self.open_file(file_id)
+        with response:
+            safe_filename, save_path = _resolve_save_path(
+                file_details.get("name", file_id), save_path
+            )
+            return self._write_response(response, save_path, f"Downloading {safe_filename}")
 
-        # Download the file
-        response = self.session.get(url_to_use, headers=headers, stream=True)
-        response.raise_for_status()
+    def download_files(
+        self, room_id: str, filenames: List[str], save_path: str = None
+    ) -> List[str]:
+        """Download several files from a room.
 
-        # Get file size from headers if available
-        total_size = int(response.headers.get('content-length', 0))
+        This method lists the files in the room once, then downloads the requested
+        files concurrently on the client's thread pool, reusing pooled connections.
+        Files are matched by name or ID in the same way as download_file. Names
+        that match the same file download it only once, and different files with
+        the same name are saved as "name (1).ext", "name (2).ext" and so on.
 
-        # Create a progress bar
-        desc = f"Downloading {safe_filename}"
+        Args:
+            room_id (str): ID of the room to search for the files.
+            filenames (List[str]): Names or IDs of the files to download.
+            save_path (str, optional): Directory where the files should be saved.
+                                      It is created if it doesn't exist. If not
+                                      provided, the files will be saved in the
+                                      current directory.
 
-        # Save the file with progress bar
-        with open(save_path, "wb") as f:
-            with tqdm(total=total_size, unit='B', unit_scale=True, desc=desc) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # filter out keep-alive new chunks
-                        f.write(chunk)
-                        pbar.update(len(chunk))
+        Returns:
+            List[str]: The paths where the files were saved, in the order requested.
 
-        return save_path
+        Raises:
+            WebexAPIError: If there's an error with the API request.
+            FileNotFoundError: If one of the files is not found in the room.
+            FileExistsError: If save_path exists but is not a directory.
+        """
+        # Get list of files in the room, and find every file before downloading any
+        files = self.list_files(room_id)
+        file_index = _index_files(files)
+        found = [_find_listed_file(files, file_index, filename) for filename in filenames]
+
+        # The files are saved side by side, so save_path must be a directory
+        if save_path:
+            os.makedirs(save_path, exist_ok=True)
+
+        # Several names can resolve to the same file, which is downloaded once.
+        # Different files with the same safe filename get numbered names, so no
+        # two downloads write the same path.
+        paths = []
+        downloads = {}
+        path_by_file = {}
+        for filename, file_info in zip(filenames, found):
+            file_key = file_info.get("id") or file_info["url"]
+            path = path_by_file.get(file_key)
+            if path is None:
+                _, path = _resolve_save_path(
+                    file_info["filename"] or filename, save_path
+                )
+                stem, extension = os.path.splitext(path)
+                for copy in itertools.count(1):
+                    if path not in downloads:
+                        break
+                    path = f"{stem} ({copy}){extension}"
+                path_by_file[file_key] = path
+                downloads[path] = (file_info, os.path.basename(path))
+            paths.append(path)
+
+        list(
+            self._executor.map(
+                lambda path: self._download_listed_file(*downloads[path], path), downloads
+            )
+        )
+        return paths
+
+    def _download_listed_file(self, file_info: Dict, safe_filename: str, save_path: str) -> str:
+        """Download a file found in a room's file list.
+
+        Args:
+            file_info (Dict): The file information, as returned by list_files.
+            safe_filename (str): The filename made safe for the filesystem, shown
+                                 next to the progress bar.
+            save_path (str): Path where the file should be saved.
+
+        Returns:
+            str: The path where the file was saved.
+        """
+        # Use download_url if available, otherwise use file_url
+        url_to_use = file_info.get("downloadUrl") or file_info["url"]
+
+        # Download the file
+        return self._stream_to_file(url_to_use, save_path, f"Downloading {safe_filename}")
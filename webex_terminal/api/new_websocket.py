@@ -11,6 +11,7 @@ from enum import Enum
 from typing import Dict, Callable, Optional, Any, List
 
 from webex_terminal.auth.auth import get_token
+from webex_terminal.api.async_client import AsyncWebexClient
 from webex_terminal.api.client import WebexClient, WebexAPIError
 
 
@@ -38,6 +39,8 @@ class WebexWebsocket:
 
     Attributes:
         client (WebexClient): An authenticated Webex API client.
+        async_client (AsyncWebexClient): Asyncio front end for ``client``, used for
+            lookups made from the event loop.
         websocket: The websocket connection.
         device_info (dict): Information about the registered device.
         running (bool): Whether the websocket is currently running.
@@ -63,6 +66,7 @@ class WebexWebsocket:
             None
         """
         self.client = WebexClient()
+        self.async_client = AsyncWebexClient(self.client)
         self.websocket = None
         self.device_info = None
         self.running = False
@@ -129,7 +133,8 @@ class WebexWebsocket:
                     error_json = response.json()
                     if "message" in error_json:
                         error_msg = f"{error_msg} - {error_json['message']}"
-                except:
+                except (ValueError, TypeError):
+                    # The error body is not a JSON object
                     pass
 
                 print(f"Device registration failed: {error_msg}")
@@ -298,7 +303,8 @@ class WebexWebsocket:
                                     try:
                                         pong_waiter = await ws.ping()
                                         await asyncio.wait_for(pong_waiter, timeout=5)
-                                    except:
+                                    except Exception:
+                                        # Timed out or closed; cancellation still propagates
                                         print(
                                             "Websocket connection is dead, reconnecting..."
                                         )
@@ -427,7 +433,7 @@ class WebexWebsocket:
 
                             # Get the full message details - convert UUID to Hydra ID first
                             hydra_id = self.build_hydra_id(message_id)
-                            message = self.client.get_message(hydra_id)
+                            message = await self.async_client.get_message(hydra_id)
 
                             # Yield control back to the event loop after getting message details
                             await asyncio.sleep(0)
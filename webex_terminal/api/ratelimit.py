@@ -0,0 +1,57 @@
+"""
+Client-side rate limiting for the Webex API client.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """A token bucket that spaces out requests to a steady rate.
+
+    This class holds up to ``burst`` tokens and refills them at ``rate`` tokens
+    per second. Each request takes one token, waiting for the next one if the
+    bucket is empty, so short bursts go out at once while sustained traffic is
+    held to ``rate``. It is safe to share between threads.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens the bucket holds.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10):
+        """Initialize the bucket, starting full.
+
+        Args:
+            rate (float, optional): Tokens added per second. Defaults to 10.
+            burst (int, optional): Maximum number of tokens the bucket holds.
+                Defaults to 10.
+
+        Returns:
+            None
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token from the bucket, waiting until one is available.
+
+        The lock is only held to update the token count; the wait happens
+        outside it, so other threads can reserve their own tokens meanwhile.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now; a negative count queues later callers behind it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
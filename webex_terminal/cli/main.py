@@ -28,6 +28,7 @@ from webex_terminal.auth.auth import (
     is_authenticated,
     logout as auth_logout,
 )
+from webex_terminal.api.async_client import AsyncWebexClient
 from webex_terminal.api.client import WebexClient, WebexAPIError
 from webex_terminal.api.new_websocket import create_websocket_client
 from webex_terminal.config import load_config, save_config
@@ -203,6 +204,7 @@ async def room_session(room):
         Exception: If there's an error during the room session
     """
     client = WebexClient()
+    async_client = AsyncWebexClient(client)
     websocket = None
 
     # Store the list of rooms from the most recent /rooms command
@@ -241,7 +243,7 @@ async def room_session(room):
         # Get sender info
         # noinspection PyBroadException
         try:
-            sender = client.get_person(message["personId"])
+            sender = await async_client.get_person(message["personId"])
             sender_name = sender.get("displayName", "Unknown")
         except Exception:
             sender_name = "Unknown"
@@ -293,15 +295,20 @@ async def room_session(room):
             if "files" in message:
                 file_info = "\n[Attachments]:"
 
-                # Process each file attachment
-                for file_url in message.get("files", []):
+                # Download the attachments concurrently, then process each one
+                file_urls = message.get("files", [])
+                downloads = await async_client.download_files_from_urls(
+                    file_urls, return_exceptions=True
+                )
+                for file_url, file_path in zip(file_urls, downloads):
                     file_info += f"\n- {file_url}"
 
-                    # Try to download and display image attachments
-                    try:
-                        # Download the file
-                        file_path = client.download_file_from_url(file_url)
+                    if isinstance(file_path, BaseException):
+                        file_info += f"\n  Error processing attachment: {file_path}"
+                        continue
 
+                    # Try to display image attachments
+                    try:
                         # Check if it's an image file based on extension or content type
                         image_extensions = [
                             ".jpg",
@@ -440,11 +447,10 @@ async def room_session(room):
     # Automatically display room details (same as /details command) only if not a dummy room
     if room["id"] != "dummy":
         try:
-            # Get the latest room details
-            room_details = client.get_room(room["id"])
-
-            # Get room members count
-            members = client.list_room_members(room["id"])
+            # Get the latest room details and members count concurrently
+            room_details, members = await asyncio.gather(
+                async_client.get_room(room["id"]), async_client.list_room_members(room["id"])
+            )
             member_count = len(members)
 
             # Print room details
@@ -794,11 +800,10 @@ async def room_session(room):
             WebexAPIError: If there's an error retrieving room details from the API.
         """
         try:
-            # Get the latest room details
-            room_details = client.get_room(room["id"])
-
-            # Get room members count
-            members = client.list_room_members(room["id"])
+            # Get the latest room details and members count concurrently
+            room_details, members = await asyncio.gather(
+                async_client.get_room(room["id"]), async_client.list_room_members(room["id"])
+            )
             member_count = len(members)
 
             # Print room details
@@ -888,16 +893,22 @@ async def room_session(room):
                     if "files" in message:
                         file_info = "[Attachments]:"
 
-                        # Process each file attachment
-                        for file_url in message.get("files", []):
+                        # Download the attachments concurrently, then process each one
+                        file_urls = message.get("files", [])
+                        downloads = await async_client.download_files_from_urls(
+                            file_urls, return_exceptions=True
+                        )
+                        for file_url, file_path in zip(file_urls, downloads):
                             file_info += f"\n- {file_url}"
 
-                            # Try to download and display image attachments
-                            try:
-                                # Download the file
-                                file_path = client.download_file_from_url(file_url)
-                                file_paths.append(file_path)
+                            if isinstance(file_path, BaseException):
+                                file_info += f"\n  Error processing attachment: {file_path}"
+                                file_paths.append(None)
+                                is_image_list.append(False)
+                                continue
 
+                            # Check whether the attachment is an image to display
+                            try:
                                 # Check if it's an image file based on extension or content type
                                 image_extensions = [
                                     ".jpg",
@@ -917,6 +928,7 @@ async def room_session(room):
                                     img_type = imghdr.what(file_path)
                                     is_image = img_type is not None
 
+                                file_paths.append(file_path)
                                 is_image_list.append(is_image)
                             except Exception as e:
                                 file_info += f"\n  Error processing attachment: {e}"
@@ -1282,7 +1294,8 @@ async def room_session(room):
         """Handle the /files command."""
         try:
             # Get files in the room
-            files = client.list_files(room["id"])
+            # Always show the current files; later downloads reuse this list
+            files = await async_client.list_files(room["id"], refresh=True)
 
             if not files:
                 print("\nNo files found in this room.")
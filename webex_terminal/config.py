@@ -1,6 +1,7 @@
 """
 Configuration settings for the Webex Terminal application.
 """
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -36,15 +37,27 @@ def ensure_config_dir():
 
 
 def load_config():
-    """Load configuration from file or create default if it doesn't exist."""
+    """Load configuration from file or create default if it doesn't exist.
+
+    The parsed configuration is cached for the life of the process; call
+    invalidate_config() to force the file to be read again. Each call returns
+    a copy, so callers can change it without affecting the cache.
+    """
+    return dict(_load_config_cached())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached():
+    """Read the configuration file, creating it with the defaults if needed."""
     ensure_config_dir()
 
     if not os.path.exists(CONFIG_FILE):
         save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        return dict(DEFAULT_CONFIG)
 
     with open(CONFIG_FILE, "r") as f:
-        return yaml.safe_load(f)
+        # An empty file parses to None
+        return yaml.safe_load(f) or {}
 
 
 def save_config(config):
@@ -54,6 +67,13 @@ def save_config(config):
     with open(CONFIG_FILE, "w") as f:
         yaml.dump(config, f)
 
+    invalidate_config()
+
+
+def invalidate_config():
+    """Clear the cached configuration so the next load_config() rereads the file."""
+    _load_config_cached.cache_clear()
+
 
 def load_token():
     """Load OAuth token from file."""